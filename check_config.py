@@ -6,8 +6,9 @@ Validates environment, directories, and deployment readiness.
 
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 import os
+import stat
 from urllib.parse import urlparse
 
 # Color codes for terminal output
@@ -19,6 +20,25 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Accepted URL prefixes for URL-valued variables; same as config.URL_PREFIXES,
+# copied because importing config builds Settings, which is what this
+# script has to diagnose
+URL_PREFIXES = ('http://', 'https://')
+
+# Snapshot of os.environ, taken once per run by _snapshot_env()
+_ENV_CACHE: Optional[Dict[str, str]] = None
+
+def _snapshot_env() -> Dict[str, str]:
+    """Copy the environment once so every check reads the same values."""
+    global _ENV_CACHE
+    _ENV_CACHE = dict(os.environ)
+    return _ENV_CACHE
+
+def get_cached(var_name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable from the cached snapshot."""
+    env = _ENV_CACHE if _ENV_CACHE is not None else _snapshot_env()
+    return env.get(var_name, default)
+
 def print_header(text: str):
     """Print section header."""
     print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 70}{Colors.END}")
@@ -41,14 +61,19 @@ def print_info(text: str):
     """Print info message."""
     print(f"{Colors.BLUE}ℹ {text}{Colors.END}")
 
-def check_env_var(var_name: str, required: bool = True, expected_prefix: str = None) -> Tuple[bool, str]:
+def check_env_var(var_name: str, env: Optional[Mapping[str, str]] = None,
+                  required: bool = True, expected_prefix: str = None) -> Tuple[bool, str]:
     """
     Check if environment variable is set and valid.
     
+    Args:
+        var_name: Variable to check
+        env: Environment snapshot to read from (default: cached os.environ copy)
+    
     Returns:
         (is_valid, value)
     """
-    value = os.getenv(var_name)
+    value = env.get(var_name) if env is not None else get_cached(var_name)
     
     if value is None or value == '':
         if required:
@@ -56,35 +81,31 @@ def check_env_var(var_name: str, required: bool = True, expected_prefix: str = N
         return True, ''
     
     # Validate URL format if expected
-    if expected_prefix and not (value.startswith('http://') or value.startswith('https://')):
+    if expected_prefix and not value.startswith(URL_PREFIXES):
         return False, value
     
     return True, value
 
 def check_directory(path: Path, should_exist: bool = True) -> bool:
     """Check if directory exists and is writable."""
-    if not path.exists():
-        if should_exist:
-            return False
-        return True
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return not should_exist
     
-    if not path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         return False
     
     # Check if writable
-    test_file = path / '.write_test'
-    try:
-        test_file.touch()
-        test_file.unlink()
-        return True
-    except Exception:
-        return False
+    return os.access(path, os.W_OK)
 
 def main():
     """Run all configuration checks."""
     
     print_header("🔍 YouTube to Podcast - Configuration Checker")
     
+    env = _snapshot_env()
+    
     errors = []
     warnings = []
     
@@ -100,7 +121,7 @@ def main():
     }
     
     for var_name, prefix in required_vars.items():
-        is_valid, value = check_env_var(var_name, required=True, expected_prefix=prefix)
+        is_valid, value = check_env_var(var_name, env, required=True, expected_prefix=prefix)
         
         if not is_valid:
             if not value:
@@ -124,18 +145,18 @@ def main():
     
     print("\n" + Colors.BOLD + "Optional Variables:" + Colors.END)
     for var_name, _ in optional_vars.items():
-        is_valid, value = check_env_var(var_name, required=False)
+        is_valid, value = check_env_var(var_name, env, required=False)
         if value:
             print_success(f"{var_name} = {value}")
         else:
             print_info(f"{var_name} not set (using default)")
     
     # Auto-publish specific checks
-    auto_publish = os.getenv('AUTO_PUBLISH', 'manual')
+    auto_publish = env.get('AUTO_PUBLISH', 'manual')
     if auto_publish == 'github':
         print("\n" + Colors.BOLD + "GitHub Auto-Publish Configuration:" + Colors.END)
-        is_valid, github_repo = check_env_var('GITHUB_REPO', required=False)
-        is_valid2, github_branch = check_env_var('GITHUB_BRANCH', required=False)
+        is_valid, github_repo = check_env_var('GITHUB_REPO', env, required=False)
+        is_valid2, github_branch = check_env_var('GITHUB_BRANCH', env, required=False)
         
         if github_repo:
             print_success(f"GITHUB_REPO = {github_repo}")
@@ -153,7 +174,7 @@ def main():
         mave_vars = ['MAVE_WEBDAV_URL', 'MAVE_USERNAME', 'MAVE_PASSWORD']
         mave_ok = True
         for var in mave_vars:
-            is_valid, value = check_env_var(var, required=False)
+            is_valid, value = check_env_var(var, env, required=False)
             if value:
                 # Mask password
                 display_value = '***' if 'PASSWORD' in var else value
@@ -197,7 +218,20 @@ def main():
     
     rss_file = podcast_dir / "rss.xml"
     
-    if rss_file.exists():
+    try:
+        os.stat(rss_file)
+        rss_exists = True
+    except FileNotFoundError:
+        rss_exists = False
+    
+    if not rss_exists:
+        print_info(f"RSS file does not exist yet: {rss_file}")
+    elif os.access(rss_file, os.R_OK | os.W_OK):
+        # Common case: one access() call covers both checks
+        print_success(f"RSS file readable: {rss_file}")
+        print_success(f"RSS file writable: {rss_file}")
+    else:
+        # Probe each permission separately only to report which one failed
         if os.access(rss_file, os.R_OK):
             print_success(f"RSS file readable: {rss_file}")
         else:
@@ -209,16 +243,14 @@ def main():
         else:
             print_error(f"RSS file not writable: {rss_file}")
             errors.append("RSS file exists but not writable")
-    else:
-        print_info(f"RSS file does not exist yet: {rss_file}")
     
     # =========================================================================
     # 4. URL Configuration Validation
     # =========================================================================
     print_header("4️⃣  URL Configuration")
     
-    site_url = os.getenv('SITE_URL', '')
-    media_base_url = os.getenv('MEDIA_BASE_URL', '')
+    site_url = env.get('SITE_URL', '')
+    media_base_url = env.get('MEDIA_BASE_URL', '')
     
     if site_url and media_base_url:
         # Parse URLs
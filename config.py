@@ -3,17 +3,71 @@ Configuration settings for YouTube to Podcast converter.
 """
 
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Dict, Mapping, Optional, Literal
 from dataclasses import dataclass, field
-from decouple import config, UndefinedValueError
+from functools import lru_cache
+from decouple import RepositoryEnv
+import os
 import sys
 
 
+ENV_FILE = Path(__file__).parent / '.env'
+
+# Accepted URL prefixes for SITE_URL / MEDIA_BASE_URL
+URL_PREFIXES = ('http://', 'https://')
+
+# Settings field -> (environment variable, cast). Defaults live on the
+# Settings fields, so unset variables simply aren't passed in.
+ENV_FIELDS = {
+    'site_url': ('SITE_URL', str),
+    'media_base_url': ('MEDIA_BASE_URL', str),
+    'audio_format': ('AUDIO_FORMAT', str),
+    'audio_quality': ('AUDIO_QUALITY', str),
+    'feed_max_items': ('FEED_MAX_ITEMS', int),
+    'podcast_title': ('PODCAST_TITLE', str),
+    'podcast_description': ('PODCAST_DESCRIPTION', str),
+    'podcast_author': ('PODCAST_AUTHOR', str),
+    'podcast_language': ('PODCAST_LANGUAGE', str),
+    'podcast_category': ('PODCAST_CATEGORY', str),
+    'podcast_image': ('PODCAST_IMAGE', str),
+    'assemblyai_api_key': ('ASSEMBLYAI_API_KEY', str),
+    'openai_api_key': ('OPENAI_API_KEY', str),
+    'openai_model': ('OPENAI_MODEL', str),
+    'auto_publish': ('AUTO_PUBLISH', str),
+    'github_repo': ('GITHUB_REPO', str),
+    'github_branch': ('GITHUB_BRANCH', str),
+    'mave_webdav_url': ('MAVE_WEBDAV_URL', str),
+    'mave_username': ('MAVE_USERNAME', str),
+    'mave_password': ('MAVE_PASSWORD', str),
+    'mave_ftp_host': ('MAVE_FTP_HOST', str),
+    'mave_ftp_port': ('MAVE_FTP_PORT', int),
+}
+
+
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or incomplete."""
     pass
 
 
+@lru_cache(maxsize=1)
+def _read_env_file() -> Dict[str, str]:
+    """Parse the .env file once per process."""
+    if not ENV_FILE.is_file():
+        return {}
+    return dict(RepositoryEnv(str(ENV_FILE)).data)
+
+
+def _load_env() -> Dict[str, str]:
+    """
+    Merge .env values with the process environment.
+    
+    Environment variables take precedence over .env, as with python-decouple.
+    """
+    env = dict(_read_env_file())
+    env.update(os.environ)
+    return env
+
+
 @dataclass
 class Settings:
     """
@@ -21,87 +75,77 @@ class Settings:
     
     All settings can be overridden via environment variables.
     Required settings: SITE_URL, MEDIA_BASE_URL
+    
+    Use Settings.from_env() (or get_settings()) to load values from the
+    environment; calling Settings() directly only applies the defaults.
     """
     
     # Required settings (must be set via environment or .env)
-    site_url: str = field(default_factory=lambda: config('SITE_URL', default=''))
-    media_base_url: str = field(default_factory=lambda: config('MEDIA_BASE_URL', default=''))
+    site_url: str = ''
+    media_base_url: str = ''
     
     # Audio settings
-    audio_format: Literal['m4a', 'mp3'] = field(
-        default_factory=lambda: config('AUDIO_FORMAT', default='m4a', cast=str)
-    )
-    audio_quality: str = field(
-        default_factory=lambda: config('AUDIO_QUALITY', default='best', cast=str)
-    )
+    audio_format: Literal['m4a', 'mp3'] = 'm4a'
+    audio_quality: str = 'best'
     
     # Feed settings
-    feed_max_items: int = field(
-        default_factory=lambda: config('FEED_MAX_ITEMS', default=50, cast=int)
-    )
+    feed_max_items: int = 50
     
     # Podcast metadata
-    podcast_title: str = field(
-        default_factory=lambda: config('PODCAST_TITLE', default='YouTube to Podcast', cast=str)
-    )
-    podcast_description: str = field(
-        default_factory=lambda: config('PODCAST_DESCRIPTION', 
-                                      default='Personal podcast feed generated from YouTube videos', 
-                                      cast=str)
-    )
-    podcast_author: str = field(
-        default_factory=lambda: config('PODCAST_AUTHOR', default='Your Name', cast=str)
-    )
-    podcast_language: str = field(
-        default_factory=lambda: config('PODCAST_LANGUAGE', default='en', cast=str)
-    )
-    podcast_category: str = field(
-        default_factory=lambda: config('PODCAST_CATEGORY', default='Technology', cast=str)
-    )
-    podcast_image: Optional[str] = field(
-        default_factory=lambda: config('PODCAST_IMAGE', default=None)
-    )
+    podcast_title: str = 'YouTube to Podcast'
+    podcast_description: str = 'Personal podcast feed generated from YouTube videos'
+    podcast_author: str = 'Your Name'
+    podcast_language: str = 'en'
+    podcast_category: str = 'Technology'
+    podcast_image: Optional[str] = None
 
     # AI/LLM/Transcription settings (optional)
-    assemblyai_api_key: Optional[str] = field(
-        default_factory=lambda: config('ASSEMBLYAI_API_KEY', default=None)
-    )
-    openai_api_key: Optional[str] = field(
-        default_factory=lambda: config('OPENAI_API_KEY', default=None)
-    )
-    openai_model: str = field(
-        default_factory=lambda: config('OPENAI_MODEL', default='gpt-4o-mini', cast=str)
-    )
+    assemblyai_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None
+    openai_model: str = 'gpt-4o-mini'
     
     # Auto-publish settings
-    auto_publish: str = field(
-        default_factory=lambda: config('AUTO_PUBLISH', default='manual', cast=str)
-    )
-    github_repo: Optional[str] = field(
-        default_factory=lambda: config('GITHUB_REPO', default=None)
-    )
-    github_branch: str = field(
-        default_factory=lambda: config('GITHUB_BRANCH', default='main', cast=str)
-    )
-    mave_webdav_url: Optional[str] = field(
-        default_factory=lambda: config('MAVE_WEBDAV_URL', default=None)
-    )
-    mave_username: Optional[str] = field(
-        default_factory=lambda: config('MAVE_USERNAME', default=None)
-    )
-    mave_password: Optional[str] = field(
-        default_factory=lambda: config('MAVE_PASSWORD', default=None)
-    )
-    mave_ftp_host: Optional[str] = field(
-        default_factory=lambda: config('MAVE_FTP_HOST', default=None)
-    )
-    mave_ftp_port: int = field(
-        default_factory=lambda: config('MAVE_FTP_PORT', default=21, cast=int)
-    )
+    auto_publish: str = 'manual'
+    github_repo: Optional[str] = None
+    github_branch: str = 'main'
+    mave_webdav_url: Optional[str] = None
+    mave_username: Optional[str] = None
+    mave_password: Optional[str] = None
+    mave_ftp_host: Optional[str] = None
+    mave_ftp_port: int = 21
     
     # Directories (computed from BASE_DIR)
     base_dir: Path = field(default_factory=lambda: Path(__file__).parent)
     
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> 'Settings':
+        """
+        Build settings from a single environment mapping.
+        
+        Args:
+            env: Variable name -> value mapping (default: .env merged with os.environ)
+        
+        Returns:
+            Settings: A validated settings instance.
+        
+        Raises:
+            ConfigurationError: If a value can't be cast or is invalid.
+        """
+        if env is None:
+            env = _load_env()
+        
+        values = {}
+        for name, (var_name, cast) in ENV_FIELDS.items():
+            if var_name not in env:
+                continue
+            try:
+                values[name] = cast(env[var_name])
+            except ValueError:
+                raise ConfigurationError(
+                    f"{var_name} must be of type {cast.__name__}, got: {env[var_name]!r}"
+                ) from None
+        return cls(**values)
+    
     @property
     def podcast_dir(self) -> Path:
         """Podcast output directory."""
@@ -149,10 +193,10 @@ class Settings:
             )
         
         # Validate URL format
-        if self.site_url and not (self.site_url.startswith('http://') or self.site_url.startswith('https://')):
+        if self.site_url and not self.site_url.startswith(URL_PREFIXES):
             errors.append(f"SITE_URL must start with http:// or https://, got: {self.site_url}")
         
-        if self.media_base_url and not (self.media_base_url.startswith('http://') or self.media_base_url.startswith('https://')):
+        if self.media_base_url and not self.media_base_url.startswith(URL_PREFIXES):
             errors.append(f"MEDIA_BASE_URL must start with http:// or https://, got: {self.media_base_url}")
         
         # Validate audio format
@@ -193,10 +237,17 @@ class Settings:
 _settings: Optional[Settings] = None
 
 
-def get_settings() -> Settings:
+def get_settings(reset_cache: bool = False) -> Settings:
     """
     Get or create the global settings instance.
     
+    The environment is read once; later calls return the same instance
+    until reset_cache is passed.
+    
+    Args:
+        reset_cache: Re-read .env and the environment and rebuild the
+                     settings instance.
+    
     Returns:
         Settings: The global settings instance.
     
@@ -204,8 +255,10 @@ def get_settings() -> Settings:
         ConfigurationError: If configuration is invalid.
     """
     global _settings
-    if _settings is None:
-        _settings = Settings()
+    if reset_cache:
+        _read_env_file.cache_clear()
+    if _settings is None or reset_cache:
+        _settings = Settings.from_env()
     return _settings
 
 
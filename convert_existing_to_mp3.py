@@ -4,15 +4,15 @@ Convert all existing M4A files to MP3 and update RSS feed.
 This script ensures maximum compatibility with all podcast players, including Light Phone.
 """
 
+import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.audio_converter import convert_to_mp3, AudioConverterError
-from utils.rss_manager import get_mime_type_from_filename
 from config import get_settings
 
 logging.basicConfig(
@@ -24,6 +24,10 @@ logger = logging.getLogger(__name__)
 
 def convert_all_to_mp3():
     """Convert all M4A files in media directory to MP3."""
+    from utils.audio_converter import convert_to_mp3, AudioConverterError
+    from utils.system import effective_cpu_count
+    from utils.rss_manager import get_mime_type_from_filename
+    
     settings = get_settings()
     media_dir = settings.media_dir
     
@@ -31,8 +35,14 @@ def convert_all_to_mp3():
         logger.error(f"Media directory not found: {media_dir}")
         return
     
-    # Find all M4A files
-    m4a_files = list(media_dir.glob('*.m4a')) + list(media_dir.glob('*.mp4'))
+    # Find all M4A/MP4 files in a single directory pass; keep the size from
+    # the DirEntry stat so it isn't re-read for logging
+    with os.scandir(media_dir) as entries:
+        m4a_files = {
+            Path(entry.path): entry.stat().st_size
+            for entry in entries
+            if entry.name.endswith(('.m4a', '.mp4')) and entry.is_file()
+        }
     
     if not m4a_files:
         logger.info("No M4A/MP4 files found to convert")
@@ -44,30 +54,40 @@ def convert_all_to_mp3():
     converted_count = 0
     failed_count = 0
     
-    for m4a_file in m4a_files:
-        try:
-            logger.info(f"\n📁 Processing: {m4a_file.name}")
-            logger.info(f"   Size: {m4a_file.stat().st_size / 1024 / 1024:.2f} MB")
-            
-            # Convert to MP3
-            mp3_file = convert_to_mp3(
-                m4a_file,
-                quality=2,  # ~190kbps VBR
-                keep_original=False  # Remove M4A after conversion
-            )
-            
-            logger.info(f"   ✅ Converted: {mp3_file.name}")
-            logger.info(f"   New size: {mp3_file.stat().st_size / 1024 / 1024:.2f} MB")
-            logger.info(f"   MIME type: {get_mime_type_from_filename(mp3_file.name)}")
-            
-            converted_count += 1
-            
-        except AudioConverterError as e:
-            logger.error(f"   ❌ Failed: {e}")
-            failed_count += 1
-        except Exception as e:
-            logger.error(f"   ❌ Unexpected error: {e}")
-            failed_count += 1
+    def convert_one(m4a_file: Path) -> Path:
+        """Convert a single file; runs in a worker thread."""
+        logger.info(f"📁 Processing: {m4a_file.name} ({m4a_files[m4a_file] / 1024 / 1024:.2f} MB)")
+        return convert_to_mp3(
+            m4a_file,
+            quality=2,  # ~190kbps VBR
+            keep_original=False,  # Remove M4A after conversion
+            threads=1  # One thread per ffmpeg process; the pool provides parallelism
+        )
+    
+    # Each conversion is an independent ffmpeg subprocess, so threads are enough
+    max_workers = min(len(m4a_files), effective_cpu_count())
+    logger.info(f"Converting with {max_workers} parallel worker(s)")
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(convert_one, m4a_file): m4a_file for m4a_file in m4a_files}
+        
+        for future in as_completed(futures):
+            m4a_file = futures[future]
+            try:
+                mp3_file = future.result()
+                
+                logger.info(f"   ✅ Converted: {m4a_file.name} -> {mp3_file.name}")
+                logger.info(f"   New size: {mp3_file.stat().st_size / 1024 / 1024:.2f} MB")
+                logger.info(f"   MIME type: {get_mime_type_from_filename(mp3_file.name)}")
+                
+                converted_count += 1
+                
+            except AudioConverterError as e:
+                logger.error(f"   ❌ Failed: {m4a_file.name}: {e}")
+                failed_count += 1
+            except Exception as e:
+                logger.error(f"   ❌ Unexpected error: {m4a_file.name}: {e}")
+                failed_count += 1
     
     logger.info("\n" + "=" * 60)
     logger.info(f"✅ Conversion complete!")
@@ -3,8 +3,45 @@
 Create a simple podcast cover image (1400x1400px).
 """
 
-from PIL import Image, ImageDraw, ImageFont
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
+
+# System fonts to try, in order of preference
+FONT_CANDIDATES = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/SFNSDisplay.ttf",
+)
+
+
+def _resolve_font_path() -> Optional[str]:
+    """Return the first available system font path, or None."""
+    for path in FONT_CANDIDATES:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=16)
+def _load_font(path: Optional[str], size: int):
+    """Load a font once per (path, size), falling back to the default font."""
+    from PIL import ImageFont
+    
+    if path is None:
+        return ImageFont.load_default()
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def _text_size(text: str, font) -> Tuple[int, int]:
+    """Return (width, height) of the rendered text."""
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
 
 def create_podcast_cover(
     output_path: Path,
@@ -25,33 +62,20 @@ def create_podcast_cover(
         bg_color: Background color
         text_color: Text color
     """
+    from PIL import Image, ImageDraw
+    
     # Create image
     img = Image.new('RGB', (size, size), bg_color)
     draw = ImageDraw.Draw(img)
     
     # Try to use a nice font, fall back to default if not available
-    try:
-        # Try common system fonts
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 180)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 80)
-    except:
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/SFNSDisplay.ttf", 180)
-            subtitle_font = ImageFont.truetype("/System/Library/Fonts/SFNSDisplay.ttf", 80)
-        except:
-            # Fall back to default font
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
+    font_path = _resolve_font_path()
+    title_font = _load_font(font_path, 180)
+    subtitle_font = _load_font(font_path, 80)
     
     # Calculate text positions (centered)
-    # Get text bounding boxes
-    title_bbox = draw.textbbox((0, 0), title, font=title_font)
-    subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-    
-    title_width = title_bbox[2] - title_bbox[0]
-    title_height = title_bbox[3] - title_bbox[1]
-    subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
-    subtitle_height = subtitle_bbox[3] - subtitle_bbox[1]
+    title_width, title_height = _text_size(title, title_font)
+    subtitle_width, subtitle_height = _text_size(subtitle, subtitle_font)
     
     # Center positions
     title_x = (size - title_width) // 2
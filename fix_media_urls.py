@@ -6,15 +6,19 @@ Fix media URLs in RSS feed to point to Railway domain.
 import sys
 from pathlib import Path
 from config import get_settings
-from utils.rss_manager import RSSManager
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of changed URLs to show in the log summary
+LOG_EXAMPLES = 5
+
 
 def fix_media_urls():
     """Update media URLs in RSS feed."""
+    from utils.rss_manager import RSSManager
+    
     try:
         settings = get_settings()
         
@@ -38,22 +42,23 @@ def fix_media_urls():
             logger.error("No RSS feed found")
             return False
         
-        # Update media URLs in all entries
-        updated_count = 0
-        for entry in fg.episodes():
-            for enclosure in entry.enclosure():
-                old_url = enclosure.get('url', '')
-                # Extract filename from old URL
-                filename = old_url.split('/')[-1]
-                # Build new URL
-                new_url = f"{settings.media_base_url}/{filename}"
-                
-                if old_url != new_url:
-                    enclosure.set('url', new_url)
-                    updated_count += 1
-                    logger.info(f"Updated: {filename}")
-                    logger.info(f"  From: {old_url}")
-                    logger.info(f"  To: {new_url}")
+        # Work out the new URL for every enclosure, then apply them in one pass
+        media_prefix = f"{rss_manager.media_base_url}/"
+        url_map = {}
+        for entry in fg.entry():
+            old_url = (entry.enclosure() or {}).get('url', '')
+            # Keep the filename, swap the base URL
+            new_url = media_prefix + old_url.rpartition('/')[2]
+            if old_url and old_url != new_url:
+                url_map[old_url] = new_url
+        
+        updated_count = rss_manager.remap_media_urls(fg, url_map)
+        
+        # Log a short summary instead of three lines per episode
+        for old_url, new_url in list(url_map.items())[:LOG_EXAMPLES]:
+            logger.info(f"Updated: {old_url} -> {new_url}")
+        if len(url_map) > LOG_EXAMPLES:
+            logger.info(f"... and {len(url_map) - LOG_EXAMPLES} more")
         
         if updated_count > 0:
             # Save updated feed
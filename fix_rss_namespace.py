@@ -4,20 +4,35 @@ Fix RSS feed namespace issues and ensure all required iTunes tags are present.
 This script regenerates the RSS feed from scratch with proper namespaces.
 """
 
+import argparse
+import re
+import shutil
 import sys
 from pathlib import Path
-import xml.etree.ElementTree as ET
 from datetime import datetime
+from typing import Iterator, Optional
 import logging
 
+from lxml import etree
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import Settings
-from utils.rss_manager import RSSManager, EpisodeData, get_mime_type_from_filename
+from config import get_settings
+from utils.rss_manager import (
+    RSSManager,
+    EpisodeData,
+    ITEM_DURATION_XPATH,
+    ITEM_ENCLOSURE_XPATH,
+    ITEM_IMAGE_HREF_XPATH,
+    MIME_MPEG,
+    get_mime_type_from_filename,
+    iter_rss_items,
+    parse_pubdate,
+)
 
 # Initialize settings
-settings = Settings()
+settings = get_settings()
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,41 +40,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Unprefixed fallbacks for feeds written without the iTunes namespace
+BARE_DURATION_XPATH = etree.XPath('duration/text()', smart_strings=False)
+BARE_IMAGE_HREF_XPATH = etree.XPath('image/@href', smart_strings=False)
+
+# Byte patterns for the post-save verification
+XMLNS_PATTERN = re.compile(rb'xmlns(?::([\w.-]+))?="([^"]*)"')
+REQUIRED_CHANNEL_TAGS = (
+    b'<language',
+    b'<itunes:author',
+    b'<itunes:image',
+    b'<itunes:explicit',
+    b'<itunes:owner',
+)
+
 
-def parse_existing_episodes(rss_file: Path) -> list[dict]:
+def parse_existing_episodes(rss_file: Path) -> Iterator[EpisodeData]:
     """
-    Parse existing RSS file to extract episode data.
+    Stream episodes out of an existing RSS file.
     
     Args:
         rss_file: Path to existing RSS file
         
-    Returns:
-        List of episode data dictionaries
+    Yields:
+        Episode data, ready to pass to RSSManager.add_episode()
+        
+    Raises:
+        etree.XMLSyntaxError: If the file is malformed; items before the
+            error have already been yielded, so callers must not save a
+            feed built from them
     """
-    episodes = []
-    
     if not rss_file.exists():
         logger.warning(f"RSS file not found: {rss_file}")
-        return episodes
+        return
     
     try:
-        tree = ET.parse(rss_file)
-        root = tree.getroot()
-        
-        # Handle both with and without namespace prefix
-        channel = root.find('channel')
-        if channel is None:
-            channel = root.find('{http://www.w3.org/2005/Atom}channel')
-        
-        if channel is None:
-            logger.error("Could not find channel element in RSS")
-            return episodes
-        
-        # Find all items
-        items = channel.findall('item')
-        logger.info(f"Found {len(items)} episode(s) in existing feed")
-        
-        for item in items:
+        for item in iter_rss_items(rss_file):
             # Extract episode data
             guid = item.findtext('guid', '')
             title = item.findtext('title', '')
@@ -68,65 +84,81 @@ def parse_existing_episodes(rss_file: Path) -> list[dict]:
             pub_date_str = item.findtext('pubDate', '')
             
             # Parse enclosure
-            enclosure = item.find('enclosure')
-            if enclosure is None:
+            enclosures = ITEM_ENCLOSURE_XPATH(item)
+            if not enclosures:
                 logger.warning(f"Episode {guid} missing enclosure, skipping")
                 continue
+            enclosure = enclosures[0]
             
-            audio_url = enclosure.get('url', '')
-            audio_size = int(enclosure.get('length', 0))
-            audio_type = enclosure.get('type', 'audio/mpeg')
+            # Parse duration (iTunes tag, falling back to an unprefixed one)
+            durations = ITEM_DURATION_XPATH(item) or BARE_DURATION_XPATH(item)
+            duration = durations[0] if durations else None
             
-            # Parse duration (iTunes tag with namespace)
-            duration = None
-            for ns in ['', '{http://www.itunes.com/dtds/podcast-1.0.dtd}']:
-                duration_elem = item.find(f'{ns}duration')
-                if duration_elem is not None:
-                    duration = duration_elem.text
-                    break
-            
-            # Parse thumbnail (iTunes image with namespace)
-            thumbnail = None
-            for ns in ['', '{http://www.itunes.com/dtds/podcast-1.0.dtd}']:
-                image_elem = item.find(f'{ns}image')
-                if image_elem is not None:
-                    thumbnail = image_elem.get('href')
-                    break
+            # Parse thumbnail (iTunes image, falling back to an unprefixed one)
+            images = ITEM_IMAGE_HREF_XPATH(item) or BARE_IMAGE_HREF_XPATH(item)
+            thumbnail = images[0] if images else None
             
             # Parse pubDate
             pub_date = datetime.now()
             if pub_date_str:
                 try:
-                    from email.utils import parsedate_to_datetime
-                    pub_date = parsedate_to_datetime(pub_date_str)
-                except:
+                    pub_date = parse_pubdate(pub_date_str)
+                except ValueError:
                     logger.warning(f"Could not parse pubDate: {pub_date_str}")
             
-            episodes.append({
-                'guid': guid,
-                'title': title,
-                'link': link,
-                'description': description,
-                'audio_url': audio_url,
-                'audio_size': audio_size,
-                'audio_type': audio_type,
-                'pub_date': pub_date,
-                'duration': duration or '00:00:00',
-                'thumbnail': thumbnail,
-            })
+            logger.debug(f"  - {title[:60]}...")
             
-            logger.info(f"  - {title[:60]}...")
+            yield EpisodeData(
+                guid=guid,
+                title=title,
+                link=link,
+                description=description,
+                audio_url=enclosure.get('url', ''),
+                audio_file_size=int(enclosure.get('length', 0)),
+                audio_mime_type=sys.intern(enclosure.get('type', MIME_MPEG)),
+                pub_date=pub_date,
+                duration=duration or '00:00:00',
+                image_url=thumbnail,
+            )
         
     except Exception as e:
         logger.error(f"Error parsing RSS file: {e}")
-        import traceback
-        traceback.print_exc()
+        raise
+
+
+def verify_feed(rss_file: Path) -> None:
+    """
+    Log the namespaces and required channel tags of a feed.
+    
+    Scans the raw bytes instead of parsing: feedgen writes every
+    channel-level tag before the first <item>, so only that header is
+    searched (item-level tags like <itunes:image> don't count).
     
-    return episodes
+    Args:
+        rss_file: Path to RSS file to check
+    """
+    header = rss_file.read_bytes().split(b'<item>', 1)[0]
+    
+    # Check namespaces
+    logger.info("\nNamespaces in new feed:")
+    for prefix, uri in XMLNS_PATTERN.findall(header):
+        logger.info(f"  - {prefix.decode() or None}: {uri.decode()}")
+    
+    # Check for required tags (iTunes ones with proper namespace)
+    logger.info("")
+    for tag in REQUIRED_CHANNEL_TAGS:
+        logger.info(f"{tag.decode()}> tag present: {tag in header}")
 
 
-def main():
+def main(argv: Optional[list[str]] = None):
     """Regenerate RSS feed with proper namespaces."""
+    parser = argparse.ArgumentParser(description="Regenerate the RSS feed with proper namespaces.")
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help="re-read the saved feed and log its namespaces and required tags",
+    )
+    args = parser.parse_args(argv)
     
     logger.info("=" * 60)
     logger.info("RSS Namespace Fix Tool")
@@ -140,22 +172,10 @@ def main():
     
     # Backup existing RSS
     backup_file = settings.rss_file.with_suffix('.xml.backup')
-    import shutil
     shutil.copy2(settings.rss_file, backup_file)
     logger.info(f"✓ Backed up existing RSS to: {backup_file}")
     
-    # Parse existing episodes
-    logger.info("\n📖 Parsing existing episodes...")
-    episodes_data = parse_existing_episodes(settings.rss_file)
-    
-    if not episodes_data:
-        logger.warning("No episodes found in existing feed")
-        return 1
-    
-    logger.info(f"✓ Found {len(episodes_data)} episode(s)")
-    
     # Create RSS manager with proper configuration
-    logger.info("\n✍️  Creating new RSS feed with proper namespaces...")
     rss_manager = RSSManager(
         site_url=settings.site_url,
         media_base_url=settings.media_base_url,
@@ -168,26 +188,26 @@ def main():
     )
     
     # Create fresh feed (not loading existing one to avoid namespace issues)
+    logger.info("\n✍️  Creating new RSS feed with proper namespaces...")
     fg = rss_manager.create_feed()
     logger.info("✓ Created new feed structure")
     
-    # Add all episodes to the new feed
-    logger.info("\n📝 Adding episodes to new feed...")
-    for ep_data in episodes_data:
-        episode = EpisodeData(
-            guid=ep_data['guid'],
-            title=ep_data['title'],
-            link=ep_data['link'],
-            description=ep_data['description'],
-            audio_url=ep_data['audio_url'],
-            audio_file_size=ep_data['audio_size'],
-            audio_mime_type=ep_data['audio_type'],
-            pub_date=ep_data['pub_date'],
-            duration=ep_data['duration'],
-            image_url=ep_data['thumbnail'],
-        )
-        rss_manager.add_episode(fg, episode)
-        logger.info(f"  ✓ {ep_data['title'][:60]}...")
+    # Stream existing episodes straight into the new feed
+    logger.info("\n📖 Parsing existing episodes and adding them to the new feed...")
+    episode_count = 0
+    try:
+        for episode in parse_existing_episodes(settings.rss_file):
+            rss_manager.add_episode(fg, episode)
+            episode_count += 1
+    except Exception:
+        logger.error("Existing feed could not be read completely, leaving it untouched")
+        return 1
+    
+    if not episode_count:
+        logger.warning("No episodes found in existing feed")
+        return 1
+    
+    logger.info(f"✓ Found {episode_count} episode(s)")
     
     # Save the new feed
     logger.info("\n💾 Saving new RSS feed...")
@@ -195,34 +215,9 @@ def main():
     logger.info(f"✓ Saved to: {settings.rss_file}")
     
     # Verify the new feed
-    logger.info("\n✅ Verifying new feed...")
-    tree = ET.parse(settings.rss_file)
-    root = tree.getroot()
-    
-    # Check namespaces
-    logger.info("\nNamespaces in new feed:")
-    for prefix, uri in root.attrib.items():
-        if prefix.startswith('{'):
-            prefix = prefix[1:-1]
-        logger.info(f"  - {prefix}: {uri}")
-    
-    # Check for required tags
-    channel = root.find('channel')
-    if channel:
-        has_language = channel.find('language') is not None
-        logger.info(f"\n<language> tag present: {has_language}")
-        
-        # Check for iTunes tags (with proper namespace)
-        itunes_ns = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
-        has_itunes_author = channel.find(f'{itunes_ns}author') is not None
-        has_itunes_image = channel.find(f'{itunes_ns}image') is not None
-        has_itunes_explicit = channel.find(f'{itunes_ns}explicit') is not None
-        has_itunes_owner = channel.find(f'{itunes_ns}owner') is not None
-        
-        logger.info(f"<itunes:author> tag present: {has_itunes_author}")
-        logger.info(f"<itunes:image> tag present: {has_itunes_image}")
-        logger.info(f"<itunes:explicit> tag present: {has_itunes_explicit}")
-        logger.info(f"<itunes:owner> tag present: {has_itunes_owner}")
+    if args.verify:
+        logger.info("\n✅ Verifying new feed...")
+        verify_feed(settings.rss_file)
     
     logger.info("\n" + "=" * 60)
     logger.info("✅ RSS feed regenerated successfully!")
@@ -6,18 +6,31 @@ Fix existing uploaded episodes in RSS feed.
 - Improve descriptions
 """
 
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from email.utils import parsedate_to_datetime
+
+from mutagen import MutagenError
+from mutagen.mp3 import MP3
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import get_settings
-from utils.rss_manager import RSSManager, EpisodeData
+from utils.rss_manager import (
+    RSSManager,
+    EpisodeData,
+    ITEM_DURATION_XPATH,
+    ITEM_ENCLOSURE_XPATH,
+    ITEM_IMAGE_HREF_XPATH,
+    MIME_MPEG,
+    iter_rss_items,
+    parse_pubdate,
+)
 from utils.audio_splitter import AudioSplitter
-import xml.etree.ElementTree as ET
 import logging
 
 logging.basicConfig(
@@ -26,6 +39,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Durations already read, keyed by (path, mtime, size)
+_duration_cache: dict[tuple[str, float, int], int] = {}
+
+
+def scan_media_dir(media_dir: Path) -> dict[str, os.DirEntry]:
+    """
+    List MP3 files in the media directory with a single scandir call.
+    
+    DirEntry caches its stat result, so sizes and mtimes read later don't
+    cost another syscall per file.
+    
+    Args:
+        media_dir: Directory containing episode media
+        
+    Returns:
+        Mapping of file name to directory entry
+    """
+    with os.scandir(media_dir) as it:
+        return {entry.name: entry for entry in it if entry.name.endswith('.mp3')}
+
+
+def fast_duration(media_file: os.DirEntry, splitter: AudioSplitter) -> int:
+    """
+    Get duration of an MP3 file in seconds.
+    
+    Reads the MPEG headers in-process with mutagen and only falls back to
+    ffprobe (via the splitter) when mutagen can't parse the file.
+    
+    Args:
+        media_file: Directory entry of the MP3 file
+        splitter: AudioSplitter used for the ffprobe fallback
+        
+    Returns:
+        Duration in seconds
+    """
+    st = media_file.stat()
+    key = (media_file.path, st.st_mtime, st.st_size)
+    if key not in _duration_cache:
+        try:
+            _duration_cache[key] = int(MP3(media_file.path).info.length)
+        except MutagenError:
+            _duration_cache[key] = splitter.get_audio_duration(Path(media_file.path))
+    return _duration_cache[key]
+
+
+def prefetch_durations(media_files: list[os.DirEntry], splitter: AudioSplitter) -> None:
+    """
+    Warm the duration cache for several files at once using a thread pool.
+    
+    Failures are ignored here; they surface again (and get reported) when
+    the duration is actually requested.
+    
+    Args:
+        media_files: Directory entries of the MP3 files to probe
+        splitter: AudioSplitter used for the ffprobe fallback
+    """
+    def probe(media_file):
+        try:
+            fast_duration(media_file, splitter)
+        except Exception:
+            pass
+    
+    if not media_files:
+        return
+    with ThreadPoolExecutor(max_workers=min(16, len(media_files))) as executor:
+        list(executor.map(probe, media_files))
+
 
 def main():
     """Fix uploaded episodes with correct metadata."""
@@ -33,101 +113,102 @@ def main():
         settings = get_settings()
         splitter = AudioSplitter()
         
-        print("🔧 Fixing uploaded episodes in RSS feed...")
-        print(f"   Media dir: {settings.media_dir}")
-        print(f"   RSS file: {settings.rss_file}")
+        logger.info("🔧 Fixing uploaded episodes in RSS feed...")
+        logger.info(f"   Media dir: {settings.media_dir}")
+        logger.info(f"   RSS file: {settings.rss_file}")
         
         if not settings.rss_file.exists():
-            print("❌ RSS file not found!")
-            return
-        
-        # Parse existing RSS
-        tree = ET.parse(settings.rss_file)
-        root = tree.getroot()
-        channel = root.find('channel')
-        
-        if channel is None:
-            print("❌ No channel found in RSS!")
+            logger.error("❌ RSS file not found!")
             return
         
-        # Find all items
-        items = channel.findall('item')
-        print(f"📖 Found {len(items)} episodes in feed")
+        media_entries = scan_media_dir(settings.media_dir)
         
-        # Group episodes by base GUID (without _partN)
-        episode_groups = {}
-        for item in items:
+        # Stream items from the existing RSS and group them by base GUID
+        # (without _partN). Items are cleared as we go, so keep a plain
+        # record of each one instead of the element itself.
+        episode_groups = defaultdict(list)
+        item_count = 0
+        for item in iter_rss_items(settings.rss_file):
+            item_count += 1
             guid_elem = item.find('guid')
             if guid_elem is None:
                 continue
             
             guid = guid_elem.text
+            record = read_item(item)
             
             # Check if it's a part
-            if '_part' in guid:
-                base_guid = guid.split('_part')[0]
-                part_num = int(guid.split('_part')[1])
-            else:
-                base_guid = guid
-                part_num = 0
-            
-            if base_guid not in episode_groups:
-                episode_groups[base_guid] = []
-            episode_groups[base_guid].append((part_num, item, guid))
+            base_guid, sep, part = guid.partition('_part')
+            part_num = int(part) if sep else 0
+            episode_groups[base_guid].append((part_num, record, guid))
         
-        print(f"📊 Found {len(episode_groups)} episode groups")
+        logger.info(f"📖 Found {item_count} episodes in feed")
+        logger.info(f"📊 Found {len(episode_groups)} episode groups")
+        
+        # Probe durations of every file we're going to need in parallel
+        to_probe = []
+        for parts in episode_groups.values():
+            parts.sort(key=lambda x: x[0])
+            is_youtube = 'youtube.com' in (parts[0][1]['link'] or '')
+            for part_num, record, guid in parts:
+                # YouTube episodes are only probed when the feed has no duration
+                if is_youtube and record['duration'] != '00:00':
+                    continue
+                media_file = media_entries.get(f"{guid}.mp3")
+                if media_file is not None:
+                    to_probe.append(media_file)
+        prefetch_durations(to_probe, splitter)
         
-        # Process each group
+        # Process each group, logging one batched message per group
         episodes_to_add = []
         
         for base_guid, parts in episode_groups.items():
             # Sort by part number
             parts.sort(key=lambda x: x[0])
             
-            print(f"\n🎵 Processing: {base_guid}")
+            group_log = [f"🎵 Processing: {base_guid}"]
             
             # Check if it's a YouTube video or uploaded file
             first_item = parts[0][1]
-            link_elem = first_item.find('link')
-            is_youtube = link_elem is not None and 'youtube.com' in (link_elem.text or '')
+            is_youtube = 'youtube.com' in (first_item['link'] or '')
             
             if is_youtube:
-                print(f"   ⏭️ Skipping YouTube video")
+                group_log.append("   ⏭️ Skipping YouTube video")
+                logger.info("\n".join(group_log))
                 # Keep YouTube episodes as-is
                 for part_num, item, guid in parts:
-                    episodes_to_add.append(extract_episode_data(item, guid, settings, splitter))
+                    episodes_to_add.append(extract_episode_data(item, guid, settings, splitter, media_entries))
                 continue
             
             # Count actual media files
             actual_parts = []
             for part_num, item, guid in parts:
-                media_file = settings.media_dir / f"{guid}.mp3"
-                if media_file.exists():
+                media_file = media_entries.get(f"{guid}.mp3")
+                if media_file is not None:
                     actual_parts.append((part_num, item, guid, media_file))
-                    print(f"   ✅ Found: {media_file.name}")
+                    group_log.append(f"   ✅ Found: {media_file.name}")
                 else:
-                    print(f"   ❌ Missing: {guid}.mp3")
+                    group_log.append(f"   ❌ Missing: {guid}.mp3")
             
             if not actual_parts:
-                print(f"   ⚠️ No media files found, skipping")
+                group_log.append("   ⚠️ No media files found, skipping")
+                logger.info("\n".join(group_log))
                 continue
             
             total_parts = len(actual_parts)
-            print(f"   📁 Total parts: {total_parts}")
+            group_log.append(f"   📁 Total parts: {total_parts}")
             
             # Get title from first part
-            title_elem = first_item.find('title')
-            base_title = title_elem.text if title_elem is not None else base_guid
+            base_title = first_item['title'] if first_item['title'] is not None else base_guid
             
             # Remove existing part suffix from title
             if '(Part' in base_title:
                 base_title = base_title.split('(Part')[0].strip()
             
             # Get base pub_date
-            pub_date_elem = first_item.find('pubDate')
-            if pub_date_elem is not None and pub_date_elem.text:
+            if first_item['pub_date']:
                 try:
-                    base_pub_date = parsedate_to_datetime(pub_date_elem.text)
+                    base_pub_date = parse_pubdate(first_item['pub_date'])
                 except:
                     base_pub_date = datetime.now()
             else:
@@ -137,7 +218,7 @@ def main():
             for idx, (part_num, item, guid, media_file) in enumerate(actual_parts, 1):
                 # Extract real duration
                 try:
-                    duration_seconds = splitter.get_audio_duration(media_file)
+                    duration_seconds = fast_duration(media_file, splitter)
                     hours = duration_seconds // 3600
                     minutes = (duration_seconds % 3600) // 60
                     seconds = duration_seconds % 60
@@ -145,10 +226,10 @@ def main():
                         duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
                     else:
                         duration = f"{minutes:02d}:{seconds:02d}"
-                    print(f"   ⏱️ {guid}: {duration}")
+                    group_log.append(f"   ⏱️ {guid}: {duration}")
                 except Exception as e:
                     duration = "01:00:00"
-                    print(f"   ⚠️ Could not get duration for {guid}: {e}")
+                    group_log.append(f"   ⚠️ Could not get duration for {guid}: {e}")
                 
                 # Create proper title
                 if total_parts > 1:
@@ -175,16 +256,18 @@ def main():
                     description=description,
                     audio_url=audio_url,
                     audio_file_size=file_size,
-                    audio_mime_type="audio/mpeg",
+                    audio_mime_type=MIME_MPEG,
                     pub_date=pub_date,
                     duration=duration,
                     image_url=None,
                 )
                 
                 episodes_to_add.append(episode)
+            
+            logger.info("\n".join(group_log))
         
         # Create new feed
-        print(f"\n✍️ Creating new RSS feed with {len(episodes_to_add)} episodes...")
+        logger.info(f"✍️ Creating new RSS feed with {len(episodes_to_add)} episodes...")
         
         rss_manager = RSSManager(
             site_url=settings.site_url,
@@ -201,48 +284,55 @@ def main():
         
         for episode in episodes_to_add:
             rss_manager.add_episode(fg, episode)
-            print(f"   ➕ {episode.title}")
+        logger.info("\n".join(f"   ➕ {episode.title}" for episode in episodes_to_add))
         
         # Save
-        rss_manager.save_feed(fg, settings.rss_file)
+        payload = rss_manager.serialize_feed(fg)
+        rss_manager.write_feed(payload, settings.rss_file)
         
-        # Also copy to docs
+        # Also write to docs
         docs_rss = settings.podcast_dir.parent / 'docs' / 'rss.xml'
         if docs_rss.parent.exists():
-            import shutil
-            shutil.copy(settings.rss_file, docs_rss)
-            print(f"   📋 Copied to: {docs_rss}")
+            docs_rss.write_bytes(payload)
+            logger.info(f"   📋 Copied to: {docs_rss}")
         
-        print(f"\n✅ RSS feed fixed successfully!")
-        print(f"📁 File: {settings.rss_file}")
-        print(f"📝 Episodes: {len(episodes_to_add)}")
+        logger.info("✅ RSS feed fixed successfully!")
+        logger.info(f"📁 File: {settings.rss_file}")
+        logger.info(f"📝 Episodes: {len(episodes_to_add)}")
         
     except Exception as e:
-        print(f"❌ Error: {e}")
+        logger.error(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
-def extract_episode_data(item, guid, settings, splitter):
-    """Extract episode data from XML item."""
-    title_elem = item.find('title')
-    link_elem = item.find('link')
-    desc_elem = item.find('description')
-    pub_date_elem = item.find('pubDate')
-    enclosure_elem = item.find('enclosure')
-    
-    itunes_ns = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
-    duration_elem = item.find(f'{itunes_ns}duration')
-    image_elem = item.find(f'{itunes_ns}image')
+def read_item(item):
+    """Copy the fields used by this script out of an XML item."""
+    enclosures = ITEM_ENCLOSURE_XPATH(item)
+    durations = ITEM_DURATION_XPATH(item)
+    images = ITEM_IMAGE_HREF_XPATH(item)
     
+    return {
+        'title': item.findtext('title'),
+        'link': item.findtext('link'),
+        'description': item.findtext('description'),
+        'pub_date': item.findtext('pubDate'),
+        'enclosure': dict(enclosures[0].attrib) if enclosures else None,
+        'duration': durations[0] if durations else '00:00',
+        'image': images[0] if images else None,
+    }
+
+
+def extract_episode_data(item, guid, settings, splitter, media_entries):
+    """Build episode data from an item record produced by read_item()."""
     # Get duration from file if not in RSS
-    duration = duration_elem.text if duration_elem is not None else '00:00'
+    duration = item['duration']
     if duration == '00:00':
-        media_file = settings.media_dir / f"{guid}.mp3"
-        if media_file.exists():
+        media_file = media_entries.get(f"{guid}.mp3")
+        if media_file is not None:
             try:
-                duration_seconds = splitter.get_audio_duration(media_file)
+                duration_seconds = fast_duration(media_file, splitter)
                 hours = duration_seconds // 3600
                 minutes = (duration_seconds % 3600) // 60
                 seconds = duration_seconds % 60
@@ -252,32 +342,32 @@ def extract_episode_data(item, guid, settings, splitter):
     
     # Get pub date
     pub_date = datetime.now()
-    if pub_date_elem is not None and pub_date_elem.text:
+    if item['pub_date']:
         try:
-            pub_date = parsedate_to_datetime(pub_date_elem.text)
+            pub_date = parse_pubdate(item['pub_date'])
         except:
             pass
     
     # Get file info
-    if enclosure_elem is not None:
-        audio_url = enclosure_elem.get('url', '')
-        file_size = int(enclosure_elem.get('length', 0))
+    if item['enclosure'] is not None:
+        audio_url = item['enclosure'].get('url', '')
+        file_size = int(item['enclosure'].get('length', 0))
     else:
         audio_url = f"{settings.media_base_url}/{guid}.mp3"
-        media_file = settings.media_dir / f"{guid}.mp3"
-        file_size = media_file.stat().st_size if media_file.exists() else 0
+        media_file = media_entries.get(f"{guid}.mp3")
+        file_size = media_file.stat().st_size if media_file is not None else 0
     
     return EpisodeData(
         guid=guid,
-        title=title_elem.text if title_elem is not None else guid,
-        link=link_elem.text if link_elem is not None else '',
-        description=desc_elem.text if desc_elem is not None else '',
+        title=item['title'] if item['title'] is not None else guid,
+        link=item['link'] if item['link'] is not None else '',
+        description=item['description'] if item['description'] is not None else '',
         audio_url=audio_url,
         audio_file_size=file_size,
-        audio_mime_type="audio/mpeg",
+        audio_mime_type=MIME_MPEG,
         pub_date=pub_date,
         duration=duration,
-        image_url=image_elem.get('href') if image_elem is not None else None,
+        image_url=item['image'],
     )
 
 
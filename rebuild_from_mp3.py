@@ -4,20 +4,56 @@ Rebuild RSS feed from existing MP3 files in media directory.
 Reads metadata from old RSS feed if available.
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import get_settings
-from utils.rss_manager import RSSManager, EpisodeData, get_mime_type_from_filename
-import xml.etree.ElementTree as ET
+from utils.rss_manager import (
+    RSSManager,
+    EpisodeData,
+    NAMESPACES,
+    get_mime_type_from_filename,
+    iter_rss_items,
+    parse_pubdate,
+    render_items,
+    splice_items,
+)
+from utils.system import effective_cpu_count
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Render <item> elements in worker processes once the catalog is this big
+PARALLEL_RENDER_MIN_EPISODES = 32
+RENDER_CHUNK_SIZE = 64
+
+
+def render_items_parallel(episodes: list[EpisodeData]) -> bytes:
+    """
+    Render episodes as <item> elements across a process pool.
+    
+    Args:
+        episodes: Episodes in the order they would be passed to add_episode()
+        
+    Returns:
+        Serialized items in feed order, ready for splice_items()
+    """
+    workers = effective_cpu_count()
+    chunk_size = min(RENDER_CHUNK_SIZE, -(-len(episodes) // workers))
+    chunks = [episodes[i:i + chunk_size] for i in range(0, len(episodes), chunk_size)]
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        shards = list(pool.map(render_items, chunks))
+    
+    # add_entry() prepends, so later chunks come first in the feed
+    return b''.join(reversed(shards))
+
 
 def main():
     """Rebuild RSS feed from MP3 files."""
@@ -28,17 +64,22 @@ def main():
     logger.info(f"   Audio format: {settings.audio_format}")
     logger.info("")
     
-    # Find all MP3 files
-    mp3_files = list(settings.media_dir.glob("*.mp3"))
+    # Find all MP3 files (DirEntry caches the stat used for sizes below),
+    # sorted by name so the feed order doesn't depend on directory order
+    with os.scandir(settings.media_dir) as it:
+        mp3_files = sorted(
+            (entry for entry in it if entry.name.endswith('.mp3') and not entry.name.startswith('.')),
+            key=lambda entry: entry.name,
+        )
     
     if not mp3_files:
         logger.error("❌ No MP3 files found in media directory!")
         return
     
     logger.info(f"📁 Found {len(mp3_files)} MP3 files")
-    for f in mp3_files:
-        size_mb = f.stat().st_size / 1024 / 1024
-        logger.info(f"   • {f.name} ({size_mb:.1f} MB)")
+    logger.info("\n".join(
+        f"   • {f.name} ({f.stat().st_size / 1024 / 1024:.1f} MB)" for f in mp3_files
+    ))
     logger.info("")
     
     # Read old RSS to get metadata
@@ -47,31 +88,27 @@ def main():
     if old_rss_path.exists():
         logger.info("📖 Reading metadata from old RSS feed...")
         try:
-            tree = ET.parse(old_rss_path)
-            root = tree.getroot()
-            channel = root.find('channel')
-            if channel:
-                for item in channel.findall('item'):
-                    guid = item.find('guid')
-                    if guid is not None and guid.text:
-                        video_id = guid.text
-                        title = item.find('title')
-                        desc = item.find('description')
-                        link = item.find('link')
-                        pubDate = item.find('pubDate')
-                        
-                        duration_elem = item.find('.//{http://www.itunes.com/dtds/podcast-1.0.dtd}duration')
-                        image_elem = item.find('.//{http://www.itunes.com/dtds/podcast-1.0.dtd}image')
-                        
-                        old_metadata[video_id] = {
-                            'title': title.text if title is not None else video_id,
-                            'description': desc.text if desc is not None else '',
-                            'link': link.text if link is not None else '',
-                            'pub_date': pubDate.text if pubDate is not None else None,
-                            'duration': duration_elem.text if duration_elem is not None else '00:00',
-                            'thumbnail': image_elem.get('href') if image_elem is not None else None,
-                        }
-                logger.info(f"   Found metadata for {len(old_metadata)} episodes")
+            for item in iter_rss_items(old_rss_path):
+                guid = item.find('guid')
+                if guid is not None and guid.text:
+                    video_id = guid.text
+                    title = item.find('title')
+                    desc = item.find('description')
+                    link = item.find('link')
+                    pubDate = item.find('pubDate')
+                    
+                    duration_elem = item.find('itunes:duration', NAMESPACES)
+                    image_elem = item.find('itunes:image', NAMESPACES)
+                    
+                    old_metadata[video_id] = {
+                        'title': title.text if title is not None else video_id,
+                        'description': desc.text if desc is not None else '',
+                        'link': link.text if link is not None else '',
+                        'pub_date': pubDate.text if pubDate is not None else None,
+                        'duration': duration_elem.text if duration_elem is not None else '00:00',
+                        'thumbnail': image_elem.get('href') if image_elem is not None else None,
+                    }
+            logger.info(f"   Found metadata for {len(old_metadata)} episodes")
         except Exception as e:
             logger.warning(f"   ⚠️  Could not read old RSS: {e}")
     logger.info("")
@@ -92,9 +129,11 @@ def main():
     logger.info("✍️  Creating new RSS feed...")
     fg = rss_manager.create_feed()
     
-    # Add episodes
+    # Collect episodes (details are logged in one batch after the loop)
+    episodes = []
+    episode_log = []
     for mp3_file in mp3_files:
-        video_id = mp3_file.stem  # Filename without extension
+        video_id = Path(mp3_file.name).stem  # Filename without extension
         file_size = mp3_file.stat().st_size
         audio_url = f"{settings.media_base_url}/{mp3_file.name}"
         mime_type = get_mime_type_from_filename(mp3_file.name)
@@ -111,15 +150,16 @@ def main():
         pub_date = datetime.now(timezone.utc)
         if metadata.get('pub_date'):
             try:
-                from email.utils import parsedate_to_datetime
-                pub_date = parsedate_to_datetime(metadata['pub_date'])
+                pub_date = parse_pubdate(metadata['pub_date'])
             except:
                 pass
         
-        logger.info(f"   + {title[:60]}...")
-        logger.info(f"     File: {mp3_file.name}")
-        logger.info(f"     MIME: {mime_type}")
-        logger.info(f"     Size: {file_size / 1024 / 1024:.1f} MB")
+        episode_log.append(
+            f"   + {title[:60]}...\n"
+            f"     File: {mp3_file.name}\n"
+            f"     MIME: {mime_type}\n"
+            f"     Size: {file_size / 1024 / 1024:.1f} MB"
+        )
         
         episode = EpisodeData(
             guid=video_id,
@@ -134,19 +174,36 @@ def main():
             image_url=thumbnail,
         )
         
-        rss_manager.add_episode(fg, episode)
+        episodes.append(episode)
     
+    logger.info("\n".join(episode_log))
     logger.info("")
     logger.info("💾 Saving RSS feed...")
     
+    if len(episodes) < PARALLEL_RENDER_MIN_EPISODES:
+        for episode in episodes:
+            rss_manager.add_episode(fg, episode)
+        payload = rss_manager.serialize_feed(fg, max_items=settings.feed_max_items)
+    else:
+        # fg holds no entries here, so serialize_feed() can't count them
+        logger.info(f"Feed contains {len(episodes)} episodes")
+        max_items = settings.feed_max_items
+        if max_items and max_items > 0 and len(episodes) > max_items:
+            logger.warning(f"Feed has {len(episodes)} items, but max is {max_items}. Trimming not yet implemented.")
+        logger.info(f"   Rendering {len(episodes)} episodes in parallel...")
+        payload = splice_items(
+            rss_manager.serialize_feed(fg),
+            render_items_parallel(episodes),
+        )
+    
     # Save to podcast/rss.xml
-    rss_manager.save_feed(fg, settings.rss_file, max_items=settings.feed_max_items)
+    rss_manager.write_feed(payload, settings.rss_file)
     logger.info(f"   ✅ Saved to: {settings.rss_file}")
     
     # Also save to docs/rss.xml for GitHub Pages
     docs_rss = Path("docs/rss.xml")
     docs_rss.parent.mkdir(exist_ok=True)
-    rss_manager.save_feed(fg, docs_rss, max_items=settings.feed_max_items)
+    rss_manager.write_feed(payload, docs_rss)
     logger.info(f"   ✅ Saved to: {docs_rss}")
     
     logger.info("")
@@ -3,6 +3,7 @@
 Regenerate RSS feed with correct URLs after configuration change.
 """
 
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -11,7 +12,14 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import get_settings
-from utils.rss_manager import RSSManager, EpisodeData
+from utils.rss_manager import (
+    RSSManager,
+    EpisodeData,
+    ITUNES_DURATION,
+    ITUNES_IMAGE,
+    iter_rss_items,
+    parse_pubdate,
+)
 from utils.audio_splitter import AudioSplitter
 import logging
 
@@ -20,6 +28,96 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+def iter_existing_episodes(settings, splitter):
+    """
+    Stream episodes with a local media file out of the current feed.
+    
+    Args:
+        settings: Application settings
+        splitter: AudioSplitter used to extract missing durations
+        
+    Yields:
+        Episode data pointing at the current media URL
+    """
+    if not settings.rss_file.exists():
+        return
+    
+    mime_type = "audio/mp4" if settings.audio_format == "m4a" else "audio/mpeg"
+    media_base_url = settings.media_base_url
+    suffix = f".{settings.audio_format}"
+    
+    # List media files once instead of checking and stat-ing each episode's
+    media_entries = {}
+    if settings.media_dir.is_dir():
+        with os.scandir(settings.media_dir) as it:
+            media_entries = {entry.name: entry for entry in it if entry.name.endswith(suffix)}
+    
+    for item in iter_rss_items(settings.rss_file):
+        find = item.find
+        guid_elem = find('guid')
+        if guid_elem is None or not guid_elem.text:
+            continue
+        video_id = guid_elem.text
+        
+        # Check if media file exists
+        media_entry = media_entries.get(f"{video_id}{suffix}")
+        if media_entry is None:
+            continue
+        media_file = Path(media_entry.path)
+        
+        # Get episode data
+        title_elem = find('title')
+        desc_elem = find('description')
+        link_elem = find('link')
+        title = title_elem.text if title_elem is not None else video_id
+        print(f"   Adding: {title}")
+        
+        # Get duration, extracting it from the audio file if missing or invalid
+        duration = '00:00'
+        duration_elem = find(ITUNES_DURATION)
+        if duration_elem is not None and duration_elem.text:
+            duration = duration_elem.text
+        if not duration or duration == '00:00':
+            try:
+                audio_duration = splitter.get_audio_duration(media_file)
+                hours = audio_duration // 3600
+                minutes = (audio_duration % 3600) // 60
+                seconds = audio_duration % 60
+                duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes:02d}:{seconds:02d}"
+                print(f"      Extracted duration: {duration}")
+            except Exception as e:
+                print(f"      Warning: Could not extract duration: {e}")
+                duration = '00:00'
+        
+        # Get publication date
+        pub_date = datetime.now()
+        pub_date_elem = find('pubDate')
+        if pub_date_elem is not None and pub_date_elem.text:
+            try:
+                pub_date = parse_pubdate(pub_date_elem.text)
+            except:
+                pass
+        
+        # Get thumbnail
+        thumbnail_url = None
+        image_elem = find(ITUNES_IMAGE)
+        if image_elem is not None:
+            thumbnail_url = image_elem.get('href')
+        
+        yield EpisodeData(
+            guid=video_id,
+            title=title,
+            link=link_elem.text if link_elem is not None else f'https://youtube.com/watch?v={video_id}',
+            description=desc_elem.text if desc_elem is not None else '',
+            audio_url=f"{media_base_url}/{media_entry.name}",
+            audio_file_size=media_entry.stat().st_size,
+            audio_mime_type=mime_type,
+            pub_date=pub_date,
+            duration=duration,
+            image_url=thumbnail_url,
+        )
+
+
 def main():
     """Regenerate RSS feed with current settings."""
     try:
@@ -40,66 +138,6 @@ def main():
             image_url=settings.podcast_image,
         )
         
-        # Get existing episodes from current feed
-        existing_episodes = []
-        if settings.rss_file.exists():
-            print(f"📖 Reading existing episodes...")
-            # Parse existing feed to get episode data
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(settings.rss_file)
-            root = tree.getroot()
-            
-            # Find all items in channel
-            channel = root.find('channel')
-            if channel is not None:
-                for item in channel.findall('item'):
-                    guid_elem = item.find('guid')
-                    if guid_elem is not None and guid_elem.text:
-                        video_id = guid_elem.text
-                        
-                        # Check if media file exists
-                        media_file = settings.media_dir / f"{video_id}.{settings.audio_format}"
-                        if media_file.exists():
-                            # Get episode data
-                            title_elem = item.find('title')
-                            desc_elem = item.find('description')
-                            link_elem = item.find('link')
-                            
-                            # Get duration
-                            duration = '00:00'
-                            duration_elem = item.find('.//{http://www.itunes.com/dtds/podcast-1.0.dtd}duration')
-                            if duration_elem is not None and duration_elem.text:
-                                duration = duration_elem.text
-                            
-                            # Get publication date
-                            pub_date = datetime.now()
-                            pub_date_elem = item.find('pubDate')
-                            if pub_date_elem is not None and pub_date_elem.text:
-                                try:
-                                    from email.utils import parsedate_to_datetime
-                                    pub_date = parsedate_to_datetime(pub_date_elem.text)
-                                except:
-                                    pass
-                            
-                            # Get thumbnail
-                            thumbnail_url = None
-                            image_elem = item.find('.//{http://www.itunes.com/dtds/podcast-1.0.dtd}image')
-                            if image_elem is not None:
-                                thumbnail_url = image_elem.get('href')
-                            
-                            existing_episodes.append({
-                                'video_id': video_id,
-                                'title': title_elem.text if title_elem is not None else video_id,
-                                'description': desc_elem.text if desc_elem is not None else '',
-                                'link': link_elem.text if link_elem is not None else f'https://youtube.com/watch?v={video_id}',
-                                'duration': duration,
-                                'pub_date': pub_date,
-                                'thumbnail_url': thumbnail_url,
-                                'media_file': media_file,
-                            })
-            
-            print(f"   Found {len(existing_episodes)} existing episodes")
-        
         # Recreate feed with correct URLs
         print(f"✍️  Creating new feed...")
         fg = rss_manager.create_feed()
@@ -107,52 +145,19 @@ def main():
         # Initialize audio splitter for duration extraction
         splitter = AudioSplitter()
         
-        # Add episodes back
-        for ep in existing_episodes:
-            print(f"   Adding: {ep['title']}")
-            
-            # Get file info
-            file_size = ep['media_file'].stat().st_size
-            mime_type = "audio/mp4" if settings.audio_format == "m4a" else "audio/mpeg"
-            audio_url = f"{settings.media_base_url}/{ep['media_file'].name}"
-            
-            # Extract duration from audio file if missing or invalid
-            duration = ep['duration']
-            if not duration or duration == '00:00':
-                try:
-                    audio_duration = splitter.get_audio_duration(ep['media_file'])
-                    hours = audio_duration // 3600
-                    minutes = (audio_duration % 3600) // 60
-                    seconds = audio_duration % 60
-                    duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes:02d}:{seconds:02d}"
-                    print(f"      Extracted duration: {duration}")
-                except Exception as e:
-                    print(f"      Warning: Could not extract duration: {e}")
-                    duration = '00:00'
-            
-            # Create episode data
-            episode = EpisodeData(
-                guid=ep['video_id'],
-                title=ep['title'],
-                link=ep['link'],
-                description=ep['description'],
-                audio_url=audio_url,
-                audio_file_size=file_size,
-                audio_mime_type=mime_type,
-                pub_date=ep['pub_date'],
-                duration=duration,
-                image_url=ep['thumbnail_url'],
-            )
-            
-            rss_manager.add_episode(fg, episode)
-        
-        # Save feed
-        print(f"💾 Saving feed...")
-        rss_manager.save_feed(fg, settings.rss_file, max_items=settings.feed_max_items)
+        # Stream existing episodes from the current feed straight into the
+        # new one, keeping their order
+        print(f"📖 Streaming existing episodes...")
+        episode_count = rss_manager.stream_feed(
+            fg,
+            iter_existing_episodes(settings, splitter),
+            settings.rss_file,
+            max_items=settings.feed_max_items,
+        )
         
         print(f"\n✅ Feed regenerated successfully!")
         print(f"📁 RSS file: {settings.rss_file}")
-        print(f"📝 Episodes: {len(existing_episodes)}")
+        print(f"📝 Episodes: {episode_count}")
         
         # Show URLs
         print(f"\n🌐 Your podcast URLs:")
@@ -1,31 +1,38 @@
 #!/usr/bin/env python3
 """Update RSS feed with GitHub Releases URLs."""
-import xml.etree.ElementTree as ET
+import os
+import re
 from pathlib import Path
 
 rss_file = Path("podcast/rss.xml")
 new_base_url = "https://github.com/2vlad/vlad-podcast/releases/download/media-files"
 
+# url="..." attribute of each <enclosure> tag
+ENCLOSURE_URL = re.compile(rb'(<enclosure\b[^>]*?\burl=")([^"]+)(")')
+
 print(f"📝 Updating RSS feed URLs...")
 print(f"   New base URL: {new_base_url}")
 
-# Parse RSS
-tree = ET.parse(rss_file)
-root = tree.getroot()
-
-# Find all enclosure elements
 count = 0
-for enclosure in root.findall('.//enclosure'):
-    old_url = enclosure.get('url')
-    if old_url:
-        # Extract filename
-        filename = old_url.split('/')[-1]
-        new_url = f"{new_base_url}/{filename}"
-        enclosure.set('url', new_url)
-        print(f"   Updated: {filename}")
-        count += 1
-
-# Save
-tree.write(rss_file, encoding='UTF-8', xml_declaration=True)
+new_base = new_base_url.encode()
+
+
+def rewrite_url(match):
+    """Point an enclosure URL at the new base, keeping its filename."""
+    global count
+    # Extract filename
+    filename = match.group(2).rpartition(b'/')[2]
+    print(f"   Updated: {filename.decode()}")
+    count += 1
+    return match.group(1) + new_base + b'/' + filename + match.group(3)
+
+
+# Rewrite the raw bytes; no tree is built or re-serialized
+data = rss_file.read_bytes()
+
+# Write next to the feed and swap it in, so the live feed is never partial
+tmp_file = rss_file.with_suffix('.xml.tmp')
+tmp_file.write_bytes(ENCLOSURE_URL.sub(rewrite_url, data))
+os.replace(tmp_file, rss_file)
 print(f"\n✅ Updated {count} episode(s)")
 print(f"📁 Saved to: {rss_file}")
@@ -3,13 +3,43 @@ Audio converter utility using FFmpeg.
 Converts audio files to MP3 format with high quality settings.
 """
 
+import math
+import os
 import subprocess
 import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
+from mutagen import File as MutagenFile, MutagenError
+
+try:
+    from utils.system import effective_cpu_count
+except ImportError:
+    from system import effective_cpu_count
+
 logger = logging.getLogger(__name__)
 
+# Codec names (FFprobe and mutagen/RFC 6381) of MP3 streams that can be
+# copied into an .mp3 file without re-encoding
+MP3_CODECS = frozenset({'mp3', 'mp4a.6B', 'mp4a.69'})
+
+# Shortest chunk parallel_convert_to_mp3() splits an input into (seconds)
+MIN_PARALLEL_CHUNK_SECONDS = 600
+
+# Output sample rate of every conversion, and samples per MPEG-1 Layer III frame
+OUTPUT_SAMPLE_RATE = 44100
+MP3_FRAME_SAMPLES = 1152
+
+# Frames each parallel chunk is encoded past its boundaries and then
+# dropped, so the encoder is warmed up where the kept audio starts and ends
+CHUNK_OVERLAP_FRAMES = 50
+
+# MPEG-1 Layer III bitrates (kbit/s) by header bitrate index
+MP3_BITRATES = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+
 
 class AudioConverterError(Exception):
     """Raised when audio conversion fails."""
@@ -31,35 +61,21 @@ def is_mp3(file_path: Path) -> bool:
 
 def get_audio_info(file_path: Path) -> dict:
     """
-    Get audio file information using FFprobe.
+    Get audio file information.
+    
+    Reads the container headers with mutagen and only falls back to
+    FFprobe for formats mutagen can't parse. Results are cached per file
+    path, modification time and size.
     
     Args:
         file_path: Path to the audio file
         
     Returns:
-        Dictionary with audio info (codec, bitrate, duration, etc.)
+        Dictionary with audio info (codec, bitrate, duration)
     """
     try:
-        cmd = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-loglevel', 'error',  # Suppress warnings
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            str(file_path)
-        ]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        import json
-        return json.loads(result.stdout)
-        
+        st = file_path.stat()
+        return dict(_read_audio_info(file_path, st.st_mtime_ns, st.st_size))
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to get audio info: {e}")
         return {}
@@ -68,22 +84,74 @@ def get_audio_info(file_path: Path) -> dict:
         return {}
 
 
+@lru_cache(maxsize=1024)
+def _read_audio_info(file_path: Path, mtime_ns: int, size: int) -> dict:
+    """Read audio info for get_audio_info(); mtime_ns and size key the cache."""
+    try:
+        audio = MutagenFile(str(file_path))
+        if audio is not None:
+            return {
+                'codec': getattr(audio.info, 'codec', None) or type(audio).__name__.lower(),
+                'bitrate': getattr(audio.info, 'bitrate', None),
+                'duration': audio.info.length,
+            }
+    except MutagenError as e:
+        logger.debug(f"mutagen could not read {file_path.name}: {e}")
+    
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-loglevel', 'error',  # Suppress warnings
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        str(file_path)
+    ]
+    
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    import json
+    info = json.loads(result.stdout)
+    audio_streams = [s for s in info.get('streams', []) if s.get('codec_type') == 'audio']
+    fmt = info.get('format', {})
+    return {
+        'codec': audio_streams[0].get('codec_name') if audio_streams else None,
+        'bitrate': int(fmt['bit_rate']) if fmt.get('bit_rate') else None,
+        'duration': float(fmt['duration']) if fmt.get('duration') else None,
+    }
+
+
 def convert_to_mp3(
     input_path: Path,
     output_path: Optional[Path] = None,
     quality: int = 2,
     bitrate: Optional[str] = None,
-    keep_original: bool = False
+    keep_original: bool = False,
+    threads: Optional[int] = None,
+    ffmpeg_path: str = 'ffmpeg',
+    source_codec: Optional[str] = None
 ) -> Path:
     """
     Convert audio file to MP3 format using FFmpeg.
     
+    Inputs that already hold an MP3 stream (e.g. MP3 in an MP4 container)
+    are remuxed with stream copy instead of being re-encoded.
+    
     Args:
         input_path: Path to input audio file
         output_path: Path for output MP3 file (default: same name with .mp3)
         quality: VBR quality (0-9, where 0 is best, 2 is ~190kbps - recommended)
         bitrate: CBR bitrate (e.g., '192k', '256k') - overrides quality if set
         keep_original: If True, keeps the original file after conversion
+        threads: Number of FFmpeg threads (default: let FFmpeg decide)
+        ffmpeg_path: FFmpeg executable, e.g. resolved once with shutil.which()
+        source_codec: Codec of the input's audio stream, if the caller
+                      already knows it (default: read with get_audio_info())
         
     Returns:
         Path to the converted MP3 file
@@ -103,11 +171,39 @@ def convert_to_mp3(
     if output_path is None:
         output_path = input_path.with_suffix('.mp3')
     
+    # MP3 stream in another container: copy it out instead of re-encoding
+    if source_codec is None:
+        source_codec = get_audio_info(input_path).get('codec')
+    if source_codec in MP3_CODECS:
+        logger.info(f"Remuxing MP3 stream from {input_path.name}...")
+        remux_cmd = [
+            ffmpeg_path,
+            '-loglevel', 'error',
+            '-i', str(input_path),
+            '-vn',
+            '-c:a', 'copy',  # Copy the MP3 stream as-is
+            '-y',
+            str(output_path)
+        ]
+        try:
+            subprocess.run(remux_cmd, capture_output=True, text=True, check=True)
+            
+            logger.info(f"✅ Remux successful: {output_path.name}")
+            
+            if not keep_original and output_path != input_path:
+                logger.info(f"Removing original file: {input_path.name}")
+                input_path.unlink()
+            
+            return output_path
+            
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.warning(f"Remux failed, re-encoding instead: {e}")
+    
     logger.info(f"Converting {input_path.name} to MP3...")
     
     # Build FFmpeg command
     cmd = [
-        'ffmpeg',
+        ffmpeg_path,
         '-loglevel', 'error',  # Only show errors, suppress warnings
         '-i', str(input_path),
         '-vn',  # No video
@@ -124,6 +220,9 @@ def convert_to_mp3(
         cmd.extend(['-q:a', str(quality)])
         logger.info(f"Using VBR quality: {quality} (~{_quality_to_bitrate(quality)})")
     
+    if threads:
+        cmd.extend(['-threads', str(threads)])
+    
     # Additional settings for compatibility
     cmd.extend([
         '-ar', '44100',  # Sample rate: 44.1kHz (standard)
@@ -134,7 +233,7 @@ def convert_to_mp3(
     
     try:
         # Run conversion
-        result = subprocess.run(
+        subprocess.run(
             cmd,
             capture_output=True,
             text=True,
@@ -160,6 +259,170 @@ def convert_to_mp3(
         raise AudioConverterError(error_msg)
 
 
+def _mp3_frames(data: bytes) -> list[bytes]:
+    """
+    Split a headerless MPEG-1 Layer III stream at 44.1 kHz into its frames.
+    
+    Args:
+        data: Frames only, as written by FFmpeg with -write_xing 0 and
+              -id3v2_version 0
+        
+    Returns:
+        The frames in order
+        
+    Raises:
+        AudioConverterError: If the data isn't such a frame sequence
+    """
+    frames = []
+    pos = 0
+    while pos + 4 <= len(data):
+        b1, b2 = data[pos + 1], data[pos + 2]
+        # Sync word, MPEG-1, Layer III, 44.1 kHz
+        if data[pos] != 0xFF or b1 & 0xFE != 0xFA or (b2 >> 2) & 0x03 != 0:
+            raise AudioConverterError(f"Unexpected MP3 frame header at byte {pos}")
+        bitrate = MP3_BITRATES[b2 >> 4] if b2 >> 4 < len(MP3_BITRATES) else 0
+        if not bitrate:
+            raise AudioConverterError(f"Unsupported MP3 bitrate index at byte {pos}")
+        size = 144000 * bitrate // OUTPUT_SAMPLE_RATE + ((b2 >> 1) & 0x01)
+        frames.append(data[pos:pos + size])
+        pos += size
+    return frames
+
+
+def parallel_convert_to_mp3(
+    input_path: Path,
+    output_path: Optional[Path] = None,
+    quality: int = 2,
+    keep_original: bool = False,
+    workers: Optional[int] = None,
+    ffmpeg_path: str = 'ffmpeg'
+) -> Path:
+    """
+    Convert a long audio file to MP3 using several FFmpeg processes.
+    
+    LAME is single-threaded, so the input is encoded as consecutive time
+    chunks in parallel. To keep the joins gapless, chunk boundaries fall on
+    whole MP3 frames, every chunk is encoded CHUNK_OVERLAP_FRAMES past its
+    boundaries and only the frames inside them are kept, and the bit
+    reservoir is off so no kept frame refers to a dropped one. The encoder
+    delay is the same in every chunk, so the kept frames line up with the
+    first chunk's frame grid. The joined frames are remuxed once (stream
+    copy) to add the VBR header.
+    
+    Inputs shorter than two chunks of MIN_PARALLEL_CHUNK_SECONDS, or whose
+    duration is unknown, go through convert_to_mp3() instead.
+    
+    Args:
+        input_path: Path to input audio file
+        output_path: Path for output MP3 file (default: same name with .mp3)
+        quality: VBR quality (0-9, where 0 is best, 2 is ~190kbps - recommended)
+        keep_original: If True, keeps the original file after conversion
+        workers: Number of parallel FFmpeg processes (default: CPU count)
+        ffmpeg_path: FFmpeg executable, e.g. resolved once with shutil.which()
+        
+    Returns:
+        Path to the converted MP3 file
+        
+    Raises:
+        AudioConverterError: If conversion fails
+    """
+    if not input_path.exists():
+        raise AudioConverterError(f"Input file not found: {input_path}")
+    
+    workers = workers or effective_cpu_count()
+    info = get_audio_info(input_path)
+    duration = info.get('duration') or 0
+    num_chunks = min(workers, int(duration // MIN_PARALLEL_CHUNK_SECONDS))
+    
+    if is_mp3(input_path) or num_chunks < 2:
+        return convert_to_mp3(
+            input_path,
+            output_path,
+            quality=quality,
+            keep_original=keep_original,
+            ffmpeg_path=ffmpeg_path,
+            source_codec=info.get('codec')
+        )
+    
+    if output_path is None:
+        output_path = input_path.with_suffix('.mp3')
+    
+    frame_seconds = MP3_FRAME_SAMPLES / OUTPUT_SAMPLE_RATE
+    chunk_frames = math.ceil(duration / num_chunks / frame_seconds)
+    logger.info(f"Converting {input_path.name} to MP3 in {num_chunks} parallel chunks "
+                f"of {chunk_frames * frame_seconds:.0f}s...")
+    
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as tmp_dir:
+        chunk_files = [Path(tmp_dir) / f"chunk{i}.mp3" for i in range(num_chunks)]
+        
+        def encode_chunk(i: int) -> list[bytes]:
+            # Start CHUNK_OVERLAP_FRAMES early, except at the start of the input
+            lead_frames = CHUNK_OVERLAP_FRAMES if i else 0
+            cmd = [
+                ffmpeg_path,
+                '-loglevel', 'error',
+                '-ss', f"{(i * chunk_frames - lead_frames) * frame_seconds:.6f}",
+                '-i', str(input_path),
+                '-vn',
+                '-acodec', 'libmp3lame',
+                '-q:a', str(quality),
+                '-reservoir', '0',
+                '-threads', '1',
+            ]
+            # The last chunk runs to the end of the input
+            if i < num_chunks - 1:
+                cmd.extend(['-t', f"{(lead_frames + chunk_frames + CHUNK_OVERLAP_FRAMES) * frame_seconds:.6f}"])
+            cmd.extend([
+                '-ar', str(OUTPUT_SAMPLE_RATE),
+                '-ac', '2',
+                '-map_metadata', '-1',
+                '-write_xing', '0',
+                '-id3v2_version', '0',
+                '-y',
+                str(chunk_files[i])
+            ])
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            
+            frames = _mp3_frames(chunk_files[i].read_bytes())
+            if i < num_chunks - 1:
+                return frames[lead_frames:lead_frames + chunk_frames]
+            return frames[lead_frames:]
+        
+        joined_file = Path(tmp_dir) / "joined.mp3"
+        remux_cmd = [
+            ffmpeg_path,
+            '-loglevel', 'error',
+            '-i', str(joined_file),
+            '-c', 'copy',  # Frames are already MP3; this only adds the VBR header
+            '-y',
+            str(output_path)
+        ]
+        
+        try:
+            with ThreadPoolExecutor(max_workers=num_chunks) as executor:
+                chunks = list(executor.map(encode_chunk, range(num_chunks)))
+            with joined_file.open('wb') as f:
+                for frames in chunks:
+                    f.writelines(frames)
+            subprocess.run(remux_cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            error_msg = f"FFmpeg conversion failed: {e.stderr}"
+            logger.error(error_msg)
+            raise AudioConverterError(error_msg)
+        except Exception as e:
+            error_msg = f"Unexpected error during conversion: {e}"
+            logger.error(error_msg)
+            raise AudioConverterError(error_msg)
+    
+    logger.info(f"✅ Conversion successful: {output_path.name}")
+    
+    if not keep_original and output_path != input_path:
+        logger.info(f"Removing original file: {input_path.name}")
+        input_path.unlink()
+    
+    return output_path
+
+
 def batch_convert_to_mp3(
     input_dir: Path,
     output_dir: Optional[Path] = None,
@@ -169,6 +432,9 @@ def batch_convert_to_mp3(
     """
     Convert all audio files in a directory to MP3.
     
+    Files are converted concurrently, one single-threaded FFmpeg process
+    per CPU core.
+    
     Args:
         input_dir: Directory containing audio files
         output_dir: Directory for output files (default: same as input)
@@ -186,18 +452,32 @@ def batch_convert_to_mp3(
     else:
         output_dir.mkdir(parents=True, exist_ok=True)
     
-    converted = []
+    # One directory pass for all extensions instead of a glob per extension
+    suffixes = {ext.lower() for ext in extensions}
+    with os.scandir(input_dir) as entries:
+        input_files = [
+            Path(entry.path)
+            for entry in entries
+            if not entry.name.startswith('.')
+            and os.path.splitext(entry.name)[1].lower() in suffixes
+            and entry.is_file()
+        ]
+    if not input_files:
+        return []
+    
+    def convert_one(input_file: Path) -> Optional[Path]:
+        try:
+            output_file = output_dir / input_file.with_suffix('.mp3').name
+            return convert_to_mp3(input_file, output_file, quality=quality, threads=1)
+        except AudioConverterError as e:
+            logger.error(f"Failed to convert {input_file.name}: {e}")
+            return None
     
-    for ext in extensions:
-        for input_file in input_dir.glob(f'*{ext}'):
-            try:
-                output_file = output_dir / input_file.with_suffix('.mp3').name
-                result = convert_to_mp3(input_file, output_file, quality=quality)
-                converted.append(result)
-            except AudioConverterError as e:
-                logger.error(f"Failed to convert {input_file.name}: {e}")
+    max_workers = min(len(input_files), effective_cpu_count())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(convert_one, input_files))
     
-    return converted
+    return [result for result in results if result is not None]
 
 
 def _quality_to_bitrate(quality: int) -> str:
@@ -5,10 +5,13 @@ Uses ffmpeg to split audio files without re-encoding (fast and lossless).
 
 import subprocess
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass
 
+from mutagen import File as MutagenFile, MutagenError
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +42,37 @@ class AudioSegment:
             return f"{minutes:02d}:{seconds:02d}"
 
 
+@lru_cache(maxsize=1024)
+def _read_audio_duration(audio_file: Path, mtime_ns: int, size: int) -> int:
+    """Read duration for AudioSplitter.get_audio_duration(); mtime_ns and size key the cache."""
+    try:
+        audio = MutagenFile(str(audio_file))
+        if audio is not None and audio.info.length:
+            return int(audio.info.length)
+    except MutagenError as e:
+        logger.debug(f"mutagen could not read {audio_file.name}: {e}")
+    
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        str(audio_file)
+    ]
+    
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return int(float(result.stdout.strip()))
+    except subprocess.CalledProcessError as e:
+        logger.error(f"ffprobe failed: {e.stderr}")
+        raise Exception(f"Failed to get audio duration: {e.stderr}")
+
+
 class AudioSplitter:
     """Split audio files into multiple segments."""
     
@@ -79,21 +113,20 @@ class AudioSplitter:
         if total_duration <= self.max_duration:
             return [(0, total_duration)]
         
-        segments = []
-        remaining = total_duration
-        start_time = 0
-        
-        while remaining > 0:
-            segment_duration = min(self.max_duration, remaining)
-            segments.append((start_time, segment_duration))
-            start_time += segment_duration
-            remaining -= segment_duration
-        
-        return segments
+        # Every segment starts a whole max_duration after the previous one;
+        # only the last one can be shorter
+        return [
+            (start_time, min(self.max_duration, total_duration - start_time))
+            for start_time in range(0, total_duration, self.max_duration)
+        ]
     
     def get_audio_duration(self, audio_file: Path) -> int:
         """
-        Get duration of audio file using ffprobe.
+        Get duration of audio file.
+        
+        Reads the container headers with mutagen and only falls back to
+        ffprobe for formats mutagen can't parse. Results are cached per
+        file path, modification time and size.
         
         Args:
             audio_file: Path to audio file
@@ -104,25 +137,8 @@ class AudioSplitter:
         Raises:
             Exception: If ffprobe fails
         """
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            str(audio_file)
-        ]
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return int(float(result.stdout.strip()))
-        except subprocess.CalledProcessError as e:
-            logger.error(f"ffprobe failed: {e.stderr}")
-            raise Exception(f"Failed to get audio duration: {e.stderr}")
+        st = audio_file.stat()
+        return _read_audio_duration(audio_file, st.st_mtime_ns, st.st_size)
     
     def split_audio(
         self,
@@ -133,7 +149,8 @@ class AudioSplitter:
         """
         Split audio file into multiple segments.
         
-        Uses ffmpeg copy mode for fast, lossless splitting.
+        Uses ffmpeg copy mode and the segment muxer, so all parts are
+        written in one fast, lossless pass over the input.
         
         Args:
             audio_file: Path to audio file to split
@@ -173,46 +190,48 @@ class AudioSplitter:
         
         extension = audio_file.suffix
         
-        # Split into segments
-        segments = []
+        # Split into all segments in a single ffmpeg pass with the segment
+        # muxer; '%' in the base name is escaped for the output pattern
+        output_pattern = output_dir / f"{base_name.replace('%', '%%')}_part%d{extension}"
+        cmd = [
+            'ffmpeg',
+            '-y',  # Overwrite output files
+            '-loglevel', 'error',  # Only show errors
+            '-i', str(audio_file),
+            '-t', str(total_duration),  # Same whole-second total as segments_info
+            '-f', 'segment',
+            '-segment_time', str(self.max_duration),
+            '-segment_start_number', '1',  # Name parts _part1, _part2, ...
+            '-reset_timestamps', '1',  # Each part starts at 0
+            '-c', 'copy',  # Copy codec (no re-encoding)
+            '-map_metadata', '0',  # Copy metadata
+            str(output_pattern)
+        ]
         
-        for i, (start_time, duration) in enumerate(segments_info, 1):
-            part_file = output_dir / f"{base_name}_part{i}{extension}"
-            
-            # Use ffmpeg to extract segment
-            # -ss: start time, -t: duration, -c copy: no re-encoding (fast)
-            cmd = [
-                'ffmpeg',
-                '-y',  # Overwrite output file
-                '-loglevel', 'error',  # Only show errors
-                '-i', str(audio_file),
-                '-ss', str(start_time),
-                '-t', str(duration),
-                '-c', 'copy',  # Copy codec (no re-encoding)
-                '-map_metadata', '0',  # Copy metadata
-                str(part_file)
-            ]
-            
-            try:
-                logger.info(f"Creating part {i}/{num_parts}: {part_file.name} ({duration}s)")
-                subprocess.run(cmd, check=True, capture_output=True)
-                
-                segment = AudioSegment(
-                    file_path=part_file,
-                    part_number=i,
-                    total_parts=num_parts,
-                    start_time=start_time,
-                    duration=duration
-                )
-                segments.append(segment)
-                
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Failed to create segment {i}: {e.stderr.decode()}")
-                # Clean up partial files
-                for seg in segments:
-                    if seg.file_path.exists():
-                        seg.file_path.unlink()
-                raise Exception(f"Failed to split audio: {e.stderr.decode()}")
+        segments = [
+            AudioSegment(
+                file_path=output_dir / f"{base_name}_part{i}{extension}",
+                part_number=i,
+                total_parts=num_parts,
+                start_time=start_time,
+                duration=duration
+            )
+            for i, (start_time, duration) in enumerate(segments_info, 1)
+        ]
+        
+        try:
+            logger.info(f"Creating {num_parts} parts: {base_name}_part1..{num_parts}{extension}")
+            subprocess.run(cmd, check=True, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to split audio: {e.stderr.decode()}")
+            # Clean up partial files
+            self.cleanup_segments(segments)
+            raise Exception(f"Failed to split audio: {e.stderr.decode()}")
+        
+        missing = [seg.file_path.name for seg in segments if not seg.file_path.exists()]
+        if missing:
+            self.cleanup_segments(segments)
+            raise Exception(f"Failed to split audio: missing parts {', '.join(missing)}")
         
         logger.info(f"Successfully split audio into {len(segments)} parts")
         return segments
@@ -3,23 +3,121 @@ YouTube audio download and metadata extraction using yt-dlp.
 Automatically converts all audio to MP3 for maximum compatibility.
 """
 
-import yt_dlp
+import json
 import logging
+import math
+import queue
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
 
 # Import audio converter for MP3 conversion
 try:
-    from utils.audio_converter import convert_to_mp3, AudioConverterError
+    from utils.audio_converter import convert_to_mp3, parallel_convert_to_mp3, AudioConverterError
 except ImportError:
-    from audio_converter import convert_to_mp3, AudioConverterError
+    from audio_converter import convert_to_mp3, parallel_convert_to_mp3, AudioConverterError
+
+try:
+    from utils.system import effective_cpu_count
+except ImportError:
+    from system import effective_cpu_count
+
+try:
+    from utils.url_processor import extract_video_id, URLError
+except ImportError:
+    from url_processor import extract_video_id, URLError
 
 logger = logging.getLogger(__name__)
 
+# yt-dlp options for metadata-only extraction
+METADATA_YDL_OPTIONS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'socket_timeout': 30,
+    # Fix for 403 errors
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'extractor_args': {'youtube': {'player_client': ['ios', 'android', 'web']}},
+}
+
+# Cheaper variant for listing: no playlist entry resolution, and no player
+# configs or watch page (description and some fields may be missing)
+LIGHT_METADATA_YDL_OPTIONS = {
+    **METADATA_YDL_OPTIONS,
+    'extract_flat': 'in_playlist',
+    'skip_download': True,
+    'extractor_args': {'youtube': {
+        'player_client': ['ios', 'android', 'web'],
+        'player_skip': ['configs', 'webpage'],
+    }},
+}
+
+# yt-dlp errors worth retrying: rate limits, server errors, network hiccups
+TRANSIENT_ERROR_PATTERN = re.compile(
+    r'HTTP Error (?:429|5\d\d)|timed out|Connection (?:reset|refused|aborted)'
+    r'|Temporary failure|Remote end closed',
+    re.IGNORECASE,
+)
 
-@dataclass
+# Minimum seconds between 'downloading' progress callbacks
+PROGRESS_INTERVAL = 0.1
+
+# Longest Retry-After we are willing to honour (seconds)
+MAX_RETRY_AFTER = 60.0
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Return the Retry-After delay of the HTTP error behind a yt-dlp error, if any."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if headers:
+            value = headers.get('Retry-After')
+            if value and value.strip().isdigit():
+                return min(float(value), MAX_RETRY_AFTER)
+        exc_info = getattr(error, 'exc_info', None)
+        error = (exc_info[1] if exc_info else None) or getattr(error, 'cause', None) or error.__cause__
+    return None
+
+
+def _with_retry(fn, *args, max_retries: int = 5, **kwargs):
+    """
+    Call a yt-dlp function, retrying transient failures with exponential backoff.
+    
+    Waits min(5s, e^(0.25 * attempt)) between attempts, or the server's
+    Retry-After when a 429 response carries one. Permanent errors (private
+    or removed videos, etc.) are raised immediately.
+    
+    Args:
+        fn: Function to call
+        max_retries: Retries after the first attempt
+        
+    Returns:
+        Whatever fn returns
+    """
+    from yt_dlp.utils import DownloadError, ExtractorError
+    
+    for attempt in range(max_retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except (DownloadError, ExtractorError) as e:
+            if attempt == max_retries or not TRANSIENT_ERROR_PATTERN.search(str(e)):
+                raise
+            delay = _retry_after(e) or min(5.0, math.exp(0.25 * attempt))
+            logger.warning(f"Transient yt-dlp error, retrying in {delay:.1f}s ({attempt + 1}/{max_retries}): {e}")
+            time.sleep(delay)
+
+
+@dataclass(slots=True, frozen=True)
 class VideoMetadata:
     """Video metadata extracted from YouTube."""
     video_id: str
@@ -30,6 +128,7 @@ class VideoMetadata:
     uploader: str
     thumbnail_url: Optional[str] = None
     webpage_url: Optional[str] = None
+    _pub_date: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def formatted_duration(self) -> str:
@@ -46,15 +145,38 @@ class VideoMetadata:
     @property
     def pub_date(self) -> datetime:
         """Convert upload_date to datetime object with UTC timezone."""
-        from datetime import timezone
-        dt = datetime.strptime(self.upload_date, "%Y%m%d")
-        return dt.replace(tzinfo=timezone.utc)
+        if self._pub_date is None:
+            # upload_date is always YYYYMMDD, so slice it instead of strptime()
+            # (computed once; the instance is frozen, hence object.__setattr__)
+            object.__setattr__(self, '_pub_date', datetime(
+                int(self.upload_date[0:4]),
+                int(self.upload_date[4:6]),
+                int(self.upload_date[6:8]),
+                tzinfo=timezone.utc,
+            ))
+        return self._pub_date
+    
+    def to_dict(self) -> Dict:
+        """Return the constructor fields as a JSON-serializable dict."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
 
 class AudioDownloader:
     """Download audio from YouTube videos using yt-dlp."""
     
-    def __init__(self, output_dir: Path, audio_format: str = "m4a", progress_callback=None):
+    def __init__(
+        self,
+        output_dir: Path,
+        audio_format: str = "m4a",
+        progress_callback=None,
+        max_workers: Optional[int] = None,
+        convert_workers: Optional[int] = None,
+        chunked_convert: bool = False,
+        fragment_workers: int = 8,
+        cache_enabled: bool = True,
+        cache_ttl_seconds: int = 24 * 3600,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize downloader.
         
@@ -63,39 +185,86 @@ class AudioDownloader:
             audio_format: Audio format (m4a or mp3)
             progress_callback: Optional callback function for progress updates
                                Called with dict: {'status': str, 'percent': float, 'speed': str, 'eta': str}
+            max_workers: Concurrent downloads in download_many()
+                         (default: up to 4, to stay clear of YouTube rate limits)
+            convert_workers: Concurrent conversions in download_many_pipelined()
+                             (default: usable CPU count)
+            chunked_convert: Encode long files to MP3 as parallel time chunks
+                             with parallel_convert_to_mp3() instead of one
+                             convert_to_mp3() process
+            fragment_workers: Fragments of an HLS/DASH stream fetched in parallel
+            cache_enabled: Cache extracted metadata on disk, keyed by video ID
+            cache_ttl_seconds: How long cached metadata stays valid (default: 24h)
+            cache_dir: Directory for the metadata cache; keep it outside any
+                       served directory (default: .cache next to output_dir)
         """
         self.output_dir = Path(output_dir)
         self.audio_format = audio_format
         self.progress_callback = progress_callback
+        self.max_workers = max_workers or min(4, effective_cpu_count())
+        self.convert_workers = convert_workers or effective_cpu_count()
+        self.chunked_convert = chunked_convert
+        self.fragment_workers = fragment_workers
+        self._progress_lock = threading.Lock()
+        self._last_progress_ts = 0.0
+        # Idle metadata YoutubeDL instances (full and light options), kept
+        # so keep-alive connections are reused across extract_metadata()
+        # calls; a pool never holds more than the peak concurrent callers
+        self._metadata_ydls = {False: queue.SimpleQueue(), True: queue.SimpleQueue()}
+        self.cache_enabled = cache_enabled
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cache_dir = Path(cache_dir) if cache_dir else self.output_dir.parent / ".cache"
+        self._cache_path = self._cache_dir / "metadata.sqlite"
+        # Resolve FFmpeg on PATH once instead of on every conversion
+        self._ffmpeg_path = shutil.which('ffmpeg')
+        # Download options are the same for every video apart from outtmpl,
+        # and idle download YoutubeDL instances are kept for reuse
+        self._options_base = self._build_options_base()
+        self._download_ydls = queue.SimpleQueue()
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        if cache_enabled:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
     
     def _progress_hook(self, d):
         """Hook for yt-dlp progress updates."""
-        if self.progress_callback:
-            if d['status'] == 'downloading':
-                # Parse percentage
-                percent_str = d.get('_percent_str', '0%').strip()
-                percent = float(percent_str.replace('%', ''))
-                
-                # Get speed and ETA
-                speed = d.get('_speed_str', 'N/A').strip()
-                eta = d.get('_eta_str', 'N/A').strip()
-                
-                self.progress_callback({
-                    'status': 'downloading',
-                    'percent': percent,
-                    'speed': speed,
-                    'eta': eta,
-                    'downloaded': d.get('downloaded_bytes', 0),
-                    'total': d.get('total_bytes', 0) or d.get('total_bytes_estimate', 0),
-                })
-            elif d['status'] == 'finished':
-                self.progress_callback({
-                    'status': 'converting',
-                    'percent': 100,
-                    'speed': 'N/A',
-                    'eta': '0s',
-                })
+        if not self.progress_callback:
+            return
+        
+        if d['status'] == 'downloading':
+            # yt-dlp calls this for every chunk; report at most every
+            # PROGRESS_INTERVAL seconds
+            now = time.monotonic()
+            if now - self._last_progress_ts < PROGRESS_INTERVAL:
+                return
+            self._last_progress_ts = now
+            
+            # Work from the raw numbers instead of parsing the display strings
+            downloaded = d.get('downloaded_bytes') or 0
+            total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+            speed = d.get('speed')
+            eta = d.get('eta')
+            
+            progress = {
+                'status': 'downloading',
+                'percent': 100.0 * downloaded / total if total else 0.0,
+                'speed': f"{speed / 1048576:.2f}MiB/s" if speed else 'N/A',
+                'eta': f"{int(eta) // 60:02d}:{int(eta) % 60:02d}" if eta is not None else 'N/A',
+                'downloaded': downloaded,
+                'total': total,
+            }
+        elif d['status'] == 'finished':
+            progress = {
+                'status': 'converting',
+                'percent': 100,
+                'speed': 'N/A',
+                'eta': '0s',
+            }
+        else:
+            return
+        
+        # Concurrent downloads share the callback, so report one at a time
+        with self._progress_lock:
+            self.progress_callback(progress)
     
     def get_yt_dlp_options(self, video_id: str) -> Dict:
         """
@@ -107,15 +276,27 @@ class AudioDownloader:
         Returns:
             Dictionary of yt-dlp options
         """
-        output_template = str(self.output_dir / f"{video_id}.%(ext)s")
+        options = dict(self._options_base)
+        options['outtmpl'] = str(self.output_dir / f"{video_id}.%(ext)s")
+        return options
+    
+    def _build_options_base(self) -> Dict:
+        """Build the yt-dlp download options shared by every video (all but outtmpl)."""
+        # For m4a, prefer an AAC source: FFmpegExtractAudio then only
+        # copies the stream into the container instead of transcoding
+        audio_selector = 'bestaudio[ext=m4a]/bestaudio/best' if self.audio_format == 'm4a' else 'bestaudio/best'
         
         options = {
-            'format': 'bestaudio/best',
-            'outtmpl': output_template,
+            'format': audio_selector,
             'quiet': False,
             'no_warnings': False,
             'extract_flat': False,
             'writethumbnail': False,
+            # Fetch HLS/DASH fragments in parallel and in large HTTP chunks
+            'concurrent_fragment_downloads': self.fragment_workers,
+            'http_chunk_size': 10 * 1024 * 1024,  # 10 MiB
+            'retries': 10,
+            'fragment_retries': 10,
             'progress_hooks': [self._progress_hook] if self.progress_callback else [],
             # Suppress FFmpeg warnings to prevent log flooding
             'postprocessor_args': {
@@ -131,6 +312,10 @@ class AudioDownloader:
             },
         }
         
+        # Point yt-dlp's postprocessors at the FFmpeg already found
+        if self._ffmpeg_path:
+            options['ffmpeg_location'] = self._ffmpeg_path
+        
         # Add postprocessors for format conversion
         if self.audio_format == 'm4a':
             options['postprocessors'] = [{
@@ -142,8 +327,12 @@ class AudioDownloader:
             options['postprocessors'] = [{
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': 'mp3',
-                'preferredquality': '320',  # 320 kbps
+                'preferredquality': '4',  # VBR ~165kbps, ample for speech
             }]
+            # libmp3lame maps compression_level to LAME's algorithm quality,
+            # 0 (slowest) to 9 (fastest); 7 is LAME's "fast" mode. The
+            # 'extractaudio' key adds to the shared 'ffmpeg' args above.
+            options['postprocessor_args']['extractaudio'] = ['-compression_level', '7']
         
         return options
     
@@ -151,34 +340,176 @@ class AudioDownloader:
         """
         Extract metadata from YouTube video without downloading.
         
+        Metadata fetched within the last cache_ttl_seconds is returned from
+        the on-disk cache without contacting YouTube.
+        
         Args:
             url: YouTube video URL
             
         Returns:
             VideoMetadata object
         """
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            # Fix for 403 errors
-            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            'extractor_args': {'youtube': {'player_client': ['ios', 'android', 'web']}},
-        }
+        video_id = None
+        if self.cache_enabled:
+            try:
+                video_id = extract_video_id(url)
+            except URLError:
+                pass
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            return VideoMetadata(
-                video_id=info['id'],
-                title=info.get('title', 'Unknown Title'),
-                description=info.get('description', ''),
-                duration=info.get('duration', 0),
-                upload_date=info.get('upload_date', datetime.now().strftime("%Y%m%d")),
-                uploader=info.get('uploader', 'Unknown'),
-                thumbnail_url=info.get('thumbnail'),
-                webpage_url=info.get('webpage_url'),
-            )
+        if video_id:
+            metadata = self._load_cached_metadata(video_id)
+            if metadata is not None:
+                logger.debug(f"Using cached metadata for {video_id}")
+                return metadata
+        
+        metadata = self._fetch_metadata(url)
+        
+        if video_id:
+            self._store_cached_metadata(video_id, metadata)
+        
+        return metadata
+    
+    def extract_metadata_light(self, url: str) -> VideoMetadata:
+        """
+        Extract basic metadata quickly, for listings.
+        
+        Skips the player configs and watch page that full extraction
+        fetches, so description (and possibly upload_date) may be missing;
+        use extract_metadata() when those are needed, e.g. before download.
+        Cached full metadata is returned when available.
+        
+        Args:
+            url: YouTube video URL
+            
+        Returns:
+            VideoMetadata object
+        """
+        if self.cache_enabled:
+            try:
+                metadata = self._load_cached_metadata(extract_video_id(url))
+                if metadata is not None:
+                    return metadata
+            except URLError:
+                pass
+        
+        with self._metadata_ydl(light=True) as ydl:
+            info = _with_retry(ydl.extract_info, url, download=False)
+        return self._metadata_from_info(info)
+    
+    def extract_playlist_metadata(self, playlist_url: str) -> List[VideoMetadata]:
+        """
+        Extract basic metadata for every video of a playlist in one request.
+        
+        Entries come from the flat playlist listing, so there is no
+        per-video request: description is empty and upload_date may fall
+        back to today. Call extract_metadata() on an entry's webpage_url
+        when full metadata is needed.
+        
+        Args:
+            playlist_url: YouTube playlist URL
+        
+        Returns:
+            VideoMetadata objects in playlist order
+        """
+        with self._metadata_ydl(light=True) as ydl:
+            info = _with_retry(ydl.extract_info, playlist_url, download=False)
+        
+        metadata = []
+        for entry in info.get('entries') or ():
+            if not entry or not entry.get('id'):
+                continue
+            thumbnails = entry.get('thumbnails') or ()
+            metadata.append(self._metadata_from_info({
+                **entry,
+                'description': entry.get('description') or '',
+                'duration': entry.get('duration') or 0,
+                'uploader': entry.get('uploader') or entry.get('channel') or 'Unknown',
+                'thumbnail': entry.get('thumbnail') or (thumbnails[-1].get('url') if thumbnails else None),
+                'webpage_url': entry.get('webpage_url') or entry.get('url')
+                               or f"https://www.youtube.com/watch?v={entry['id']}",
+            }))
+        return metadata
+    
+    def _fetch_metadata(self, url: str) -> VideoMetadata:
+        """Extract metadata from YouTube, bypassing the cache."""
+        with self._metadata_ydl() as ydl:
+            info = _with_retry(ydl.extract_info, url, download=False)
+        return self._metadata_from_info(info)
+    
+    @staticmethod
+    def _metadata_from_info(info: Dict) -> VideoMetadata:
+        """Build VideoMetadata from a yt-dlp info dict."""
+        return VideoMetadata(
+            video_id=info['id'],
+            title=info.get('title', 'Unknown Title'),
+            description=info.get('description', ''),
+            duration=info.get('duration', 0),
+            # Only format today's date when the info dict has none
+            upload_date=info.get('upload_date') or datetime.now().strftime("%Y%m%d"),
+            uploader=info.get('uploader', 'Unknown'),
+            thumbnail_url=info.get('thumbnail'),
+            webpage_url=info.get('webpage_url'),
+        )
+    
+    def _connect_cache(self) -> sqlite3.Connection:
+        """Open the metadata cache, creating its table if needed."""
+        conn = sqlite3.connect(self._cache_path, timeout=10)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta ("
+            "video_id TEXT PRIMARY KEY, json TEXT NOT NULL, fetched_at INTEGER NOT NULL)"
+        )
+        return conn
+    
+    def _load_cached_metadata(self, video_id: str) -> Optional[VideoMetadata]:
+        """Return cached metadata for a video, or None if missing or expired."""
+        try:
+            with closing(self._connect_cache()) as conn:
+                row = conn.execute(
+                    "SELECT json FROM meta WHERE video_id = ? AND fetched_at >= ?",
+                    (video_id, int(time.time()) - self.cache_ttl_seconds),
+                ).fetchone()
+            return VideoMetadata(**json.loads(row[0])) if row else None
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring metadata cache for {video_id}: {e}")
+            return None
+    
+    def _store_cached_metadata(self, video_id: str, metadata: VideoMetadata):
+        """Save metadata to the cache; failures only cost a future refetch."""
+        try:
+            with closing(self._connect_cache()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (video_id, json, fetched_at) VALUES (?, ?, ?)",
+                    (video_id, json.dumps(metadata.to_dict()), int(time.time())),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache metadata for {video_id}: {e}")
+    
+    @contextmanager
+    def _metadata_ydl(self, light: bool = False):
+        """Borrow an idle metadata YoutubeDL, creating one if all are in use."""
+        pool = self._metadata_ydls[light]
+        try:
+            ydl = pool.get_nowait()
+        except queue.Empty:
+            import yt_dlp
+            
+            ydl = yt_dlp.YoutubeDL(dict(LIGHT_METADATA_YDL_OPTIONS if light else METADATA_YDL_OPTIONS))
+        try:
+            yield ydl
+        finally:
+            pool.put(ydl)
+    
+    def close(self):
+        """Close the long-lived YoutubeDL instances and their connections."""
+        ydls = []
+        for pool in (*self._metadata_ydls.values(), self._download_ydls):
+            while True:
+                try:
+                    ydls.append(pool.get_nowait())
+                except queue.Empty:
+                    break
+        for ydl in ydls:
+            ydl.close()
     
     def download_audio(self, url: str, video_id: str) -> Path:
         """
@@ -197,10 +528,36 @@ class AudioDownloader:
         Raises:
             Exception: If download or conversion fails
         """
+        return self._convert(self._download_raw(url, video_id))
+    
+    def _download_raw(self, url: str, video_id: str) -> Path:
+        """
+        Run the yt-dlp download only, without the MP3 conversion.
+        
+        Args:
+            url: YouTube video URL
+            video_id: YouTube video ID
+            
+        Returns:
+            Path to the downloaded audio file in self.audio_format
+            
+        Raises:
+            Exception: If download fails
+        """
         options = self.get_yt_dlp_options(video_id)
         
-        with yt_dlp.YoutubeDL(options) as ydl:
-            ydl.download([url])
+        # Reuse an idle YoutubeDL, pointed at this video's output template
+        try:
+            ydl = self._download_ydls.get_nowait()
+            ydl.params['outtmpl']['default'] = options['outtmpl']
+        except queue.Empty:
+            import yt_dlp
+            ydl = yt_dlp.YoutubeDL(options)
+        
+        try:
+            _with_retry(ydl.download, [url])
+        finally:
+            self._download_ydls.put(ydl)
         
         # Find the downloaded file
         audio_file = self.output_dir / f"{video_id}.{self.audio_format}"
@@ -210,14 +567,38 @@ class AudioDownloader:
                 f"Audio file not found after download: {audio_file}"
             )
         
+        return audio_file
+    
+    def _convert(self, audio_file: Path, workers: Optional[int] = None) -> Path:
+        """
+        Convert a downloaded file to MP3, keeping the original if that fails.
+        
+        Args:
+            audio_file: File returned by _download_raw()
+            workers: Parallel FFmpeg processes for this file with
+                     chunked_convert (default: CPU count)
+            
+        Returns:
+            Path to the MP3 file, or to audio_file if conversion failed
+        """
         # Convert to MP3 for maximum compatibility
         try:
             logger.info(f"Converting {audio_file.name} to MP3 for compatibility...")
-            mp3_file = convert_to_mp3(
-                audio_file,
-                quality=2,  # ~190kbps VBR - excellent quality
-                keep_original=False  # Remove original file after conversion
-            )
+            if self.chunked_convert:
+                mp3_file = parallel_convert_to_mp3(
+                    audio_file,
+                    quality=2,  # ~190kbps VBR - excellent quality
+                    keep_original=False,  # Remove original file after conversion
+                    workers=workers,
+                    ffmpeg_path=self._ffmpeg_path or 'ffmpeg'
+                )
+            else:
+                mp3_file = convert_to_mp3(
+                    audio_file,
+                    quality=2,  # ~190kbps VBR - excellent quality
+                    keep_original=False,  # Remove original file after conversion
+                    ffmpeg_path=self._ffmpeg_path or 'ffmpeg'
+                )
             logger.info(f"✅ Conversion complete: {mp3_file.name}")
             return mp3_file
         except AudioConverterError as e:
@@ -244,3 +625,66 @@ class AudioDownloader:
         audio_file = self.download_audio(url, video_id)
         
         return audio_file, metadata
+    
+    def download_many(
+        self,
+        items: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[Path, VideoMetadata]]:
+        """
+        Download several videos concurrently.
+        
+        Downloads are network-bound, so they run in threads; each one
+        borrows an idle YoutubeDL from the downloader's pools, which grow
+        only up to the number of concurrent downloads.
+        
+        Args:
+            items: (url, video_id) pairs
+            max_workers: Concurrent downloads (default: self.max_workers)
+            
+        Returns:
+            (audio_file_path, metadata) tuples in the order of items
+        """
+        if not items:
+            return []
+        
+        workers = min(len(items), max_workers or self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.download_with_metadata(*item), items))
+    
+    def download_many_pipelined(
+        self,
+        items: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[Path, VideoMetadata]]:
+        """
+        Download several videos, converting each while the next ones download.
+        
+        Downloads run in one thread pool and hand each finished file to a
+        second pool for MP3 conversion, so network and CPU work overlap.
+        Files are converted side by side, one FFmpeg process each.
+        
+        Args:
+            items: (url, video_id) pairs
+            max_workers: Concurrent downloads (default: self.max_workers)
+            
+        Returns:
+            (audio_file_path, metadata) tuples in the order of items
+        """
+        if not items:
+            return []
+        
+        download_workers = min(len(items), max_workers or self.max_workers)
+        convert_workers = min(len(items), self.convert_workers)
+        
+        with ThreadPoolExecutor(max_workers=download_workers) as download_pool, \
+                ThreadPoolExecutor(max_workers=convert_workers) as convert_pool:
+            
+            def fetch(item):
+                url, video_id = item
+                metadata = self.extract_metadata(url)
+                audio_file = self._download_raw(url, video_id)
+                return convert_pool.submit(self._convert, audio_file, 1), metadata
+            
+            pending = list(download_pool.map(fetch, items))
+            return [(conversion.result(), metadata) for conversion, metadata in pending]
@@ -5,8 +5,9 @@ Supports multiple upload methods: WebDAV, FTP, SFTP, rsync.
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import requests
 from urllib.parse import urljoin
 
@@ -228,6 +229,29 @@ class MaveUploader:
         """
         return self.upload_file(rss_file, "rss.xml")
     
+    def upload_many(self, files: List[Tuple[Path, str]], max_workers: int = 4) -> bool:
+        """
+        Upload several files concurrently.
+        
+        Each upload opens its own connection, so independent files (e.g.
+        several episodes) go up in parallel and the batch takes as long as
+        its largest file. Upload the feed afterwards, once the files it
+        references are in place.
+        
+        Args:
+            files: (local_path, remote_filename) pairs
+            max_workers: Maximum number of simultaneous uploads
+            
+        Returns:
+            True if every upload succeeded
+        """
+        if not files:
+            return True
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            results = list(executor.map(lambda f: self.upload_file(*f), files))
+        return all(results)
+    
     def test_connection(self) -> bool:
         """
         Test connection to Mave.digital.
@@ -310,10 +334,10 @@ def upload_to_mave(
         logger.error("Connection test failed, aborting upload")
         return False
     
-    # Upload audio
-    audio_success = uploader.upload_file(audio_file, audio_file.name)
+    # Upload audio first: the feed must not point at a missing enclosure
+    if not uploader.upload_many([(audio_file, audio_file.name)]):
+        logger.error("Audio upload failed, not publishing RSS")
+        return False
     
     # Upload RSS
-    rss_success = uploader.upload_rss(rss_file)
-    
-    return audio_success and rss_success
+    return uploader.upload_rss(rss_file)
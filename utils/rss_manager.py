@@ -2,17 +2,137 @@
 RSS feed generation and management for podcast episodes.
 """
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from feedgen.feed import FeedGenerator
 from feedgen.entry import FeedEntry
-import xml.etree.ElementTree as ET
+from lxml import etree
+import jinja2
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger("rss_manager")
 
+# XML namespaces used in podcast feeds (interned: compared once per item)
+ITUNES_NS = sys.intern('http://www.itunes.com/dtds/podcast-1.0.dtd')
+NAMESPACES = {
+    'itunes': ITUNES_NS,
+    'atom': 'http://www.w3.org/2005/Atom',
+}
+
+# Precomputed Clark-notation tags for per-item iTunes lookups
+ITUNES_DURATION = sys.intern(f'{{{ITUNES_NS}}}duration')
+ITUNES_IMAGE = sys.intern(f'{{{ITUNES_NS}}}image')
+
+# Precompiled per-item lookups. smart_strings=False returns plain str
+# values that don't keep the (possibly cleared) item element alive.
+ITEM_DURATION_XPATH = etree.XPath('itunes:duration/text()', namespaces=NAMESPACES, smart_strings=False)
+ITEM_IMAGE_HREF_XPATH = etree.XPath('itunes:image/@href', namespaces=NAMESPACES, smart_strings=False)
+ITEM_ENCLOSURE_XPATH = etree.XPath('enclosure')
+
+# Default enclosure MIME type
+MIME_MPEG = sys.intern('audio/mpeg')
+
+# Month abbreviations of the fixed-width pubDate feedgen writes
+# (RFC 2822, e.g. 'Sun, 16 Nov 2025 04:32:56 +0000')
+RFC2822_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1
+    )
+}
+
+# Closing tag of a serialized feed's channel, where items are spliced in
+CHANNEL_CLOSE = b'</channel>'
+
+# Shared lxml parser for reading existing RSS files
+RSS_PARSER = etree.XMLParser(remove_blank_text=True)
+
+
+def parse_rss_file(rss_file: Path) -> etree._ElementTree:
+    """
+    Parse an RSS file with lxml using the shared parser.
+    
+    Args:
+        rss_file: Path to RSS file
+        
+    Returns:
+        Parsed lxml element tree
+    """
+    return etree.parse(str(rss_file), RSS_PARSER)
+
+
+def iter_rss_items(rss_file: Path) -> Iterator[etree._Element]:
+    """
+    Stream <item> elements from an RSS file.
+    
+    Each item is cleared (and dropped from its parent) once the caller asks
+    for the next one, so only a single item subtree is held in memory.
+    Callers must copy out any data they need before advancing.
+    
+    Args:
+        rss_file: Path to RSS file
+        
+    Yields:
+        lxml <item> elements in document order
+    """
+    for _, item in etree.iterparse(str(rss_file), events=('end',), tag='item', remove_blank_text=True):
+        yield item
+        item.clear()
+        # Release already-processed siblings as well
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+
+def parse_pubdate(value: str) -> datetime:
+    """
+    Parse an RSS pubDate.
+    
+    Slices the fixed-width format feedgen writes directly and only falls
+    back to the general RFC 2822 parser for anything else.
+    
+    Args:
+        value: pubDate text
+        
+    Returns:
+        Parsed datetime
+        
+    Raises:
+        ValueError: If the date can't be parsed
+    """
+    if (
+        len(value) == 31
+        and value[3:5] == ', '
+        and value[7] == value[11] == value[16] == value[25] == ' '
+        and value[19] == value[22] == ':'
+        and value[26] in '+-'
+        and value[5:7].isdigit()
+        and value[27:31].isdigit()
+    ):
+        try:
+            if value[26:] == '+0000':
+                tz = timezone.utc
+            else:
+                offset = timedelta(hours=int(value[27:29]), minutes=int(value[29:31]))
+                tz = timezone(-offset if value[26] == '-' else offset)
+            return datetime(
+                int(value[12:16]),
+                RFC2822_MONTHS[value[8:11]],
+                int(value[5:7]),
+                int(value[17:19]),
+                int(value[20:22]),
+                int(value[23:25]),
+                tzinfo=tz,
+            )
+        except (KeyError, ValueError):
+            pass
+    return parsedate_to_datetime(value)
+
 
 def get_mime_type_from_filename(filename: str) -> str:
     """
@@ -24,9 +144,14 @@ def get_mime_type_from_filename(filename: str) -> str:
     Returns:
         MIME type string (e.g., 'audio/mpeg' for MP3, 'audio/mp4' for M4A)
     """
-    ext = Path(filename).suffix.lower()
+    return _mime_for_ext(os.path.splitext(filename)[1])
+
+
+@lru_cache(maxsize=16)
+def _mime_for_ext(ext: str) -> str:
+    """Map a file extension (with leading dot, any case) to a MIME type."""
     mime_types = {
-        '.mp3': 'audio/mpeg',
+        '.mp3': MIME_MPEG,
         '.m4a': 'audio/mp4',
         '.mp4': 'audio/mp4',
         '.aac': 'audio/aac',
@@ -34,10 +159,10 @@ def get_mime_type_from_filename(filename: str) -> str:
         '.wav': 'audio/wav',
         '.flac': 'audio/flac',
     }
-    return mime_types.get(ext, 'audio/mpeg')  # Default to audio/mpeg (MP3)
+    return mime_types.get(ext.lower(), MIME_MPEG)  # Default to audio/mpeg (MP3)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EpisodeData:
     """Data for a podcast episode."""
     guid: str  # Unique identifier (usually video_id)
@@ -52,6 +177,188 @@ class EpisodeData:
     image_url: Optional[str] = None
 
 
+def fill_entry(fe: FeedEntry, episode: EpisodeData) -> None:
+    """
+    Populate a feed entry from episode data.
+    
+    Args:
+        fe: FeedEntry with the podcast extension registered
+        episode: Episode data
+    """
+    # Basic episode fields
+    fe.id(episode.guid)
+    fe.guid(episode.guid, permalink=False)
+    logger.debug(f"Set GUID: {episode.guid}")
+    
+    fe.title(episode.title)
+    logger.debug(f"Set title: {episode.title}")
+    
+    fe.link(href=episode.link)
+    logger.debug(f"Set link: {episode.link}")
+    
+    fe.description(episode.description)
+    logger.debug(f"Set description (length: {len(episode.description)} chars)")
+    
+    fe.pubDate(episode.pub_date)
+    logger.debug(f"Set pub date: {episode.pub_date}")
+    
+    # Enclosure (audio file)
+    logger.debug(f"Adding enclosure: {episode.audio_url}")
+    fe.enclosure(
+        url=episode.audio_url,
+        length=str(episode.audio_file_size),
+        type=episode.audio_mime_type
+    )
+    logger.debug("Enclosure added successfully")
+    
+    # iTunes episode tags
+    if episode.duration:
+        fe.podcast.itunes_duration(episode.duration)
+        logger.debug(f"Set duration: {episode.duration}")
+    
+    if episode.image_url:
+        try:
+            # Try to add thumbnail, but skip if format is not supported (e.g., WebP)
+            fe.podcast.itunes_image(episode.image_url)
+            logger.debug(f"Set thumbnail: {episode.image_url}")
+        except Exception as e:
+            logger.warning(f"Could not add thumbnail for episode {episode.guid}: {e}")
+
+
+def _xml_text(value) -> str:
+    """Escape a value for use as XML text content (as lxml does)."""
+    return str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('\r', '&#13;')
+
+
+def _xml_attr(value) -> str:
+    """Escape a value for use inside a double-quoted XML attribute (as lxml does)."""
+    return (
+        _xml_text(value)
+        .replace('"', '&quot;')
+        .replace('\n', '&#10;')
+        .replace('\t', '&#9;')
+    )
+
+
+def _itunes_image_supported(url: Optional[str]) -> bool:
+    """feedgen only accepts .jpg/.png episode images (others are skipped)."""
+    return bool(url) and url.endswith(('.jpg', '.png'))
+
+
+_ITEM_ENV = jinja2.Environment(
+    autoescape=False,  # every value goes through an explicit XML filter below
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+_ITEM_ENV.filters['xml_text'] = _xml_text
+_ITEM_ENV.filters['xml_attr'] = _xml_attr
+_ITEM_ENV.filters['rfc2822'] = format_datetime
+_ITEM_ENV.tests['itunes_image'] = _itunes_image_supported
+
+# One pretty-printed <item>, laid out exactly like feedgen's output
+ITEM_TEMPLATE = _ITEM_ENV.from_string("""\
+    <item>
+{% if e.title %}
+      <title>{{ e.title|xml_text }}</title>
+{% endif %}
+{% if e.link %}
+      <link>{{ e.link|xml_text }}</link>
+{% endif %}
+{% if e.description %}
+      <description>{{ e.description|xml_text }}</description>
+{% endif %}
+{% if e.guid %}
+      <guid isPermaLink="false">{{ e.guid|xml_text }}</guid>
+{% endif %}
+      <enclosure url="{{ e.audio_url|xml_attr }}" length="{{ e.audio_file_size|xml_attr }}" type="{{ e.audio_mime_type|xml_attr }}"/>
+      <pubDate>{{ e.pub_date|rfc2822 }}</pubDate>
+{% if e.image_url is itunes_image %}
+      <itunes:image href="{{ e.image_url|xml_attr }}"/>
+{% endif %}
+{% if e.duration %}
+      <itunes:duration>{{ e.duration|xml_text }}</itunes:duration>
+{% endif %}
+    </item>
+""")
+
+
+def render_item(episode: EpisodeData) -> bytes:
+    """
+    Serialize a single episode as a pretty-printed <item> element.
+    
+    Args:
+        episode: Episode to render
+        
+    Returns:
+        Serialized <item> element
+    """
+    return ITEM_TEMPLATE.render(e=episode).encode('utf-8')
+
+
+def render_items(episodes: List[EpisodeData]) -> bytes:
+    """
+    Serialize episodes as pretty-printed <item> elements.
+    
+    Renders ITEM_TEMPLATE directly instead of going through feedgen entries
+    and lxml elements. The items come out in the same order and with the
+    same bytes as RSSManager.add_episode() + serialize_feed() would produce,
+    so shards can be rendered in worker processes and spliced into a feed
+    with splice_items().
+    
+    Args:
+        episodes: Episodes in the order they would be passed to add_episode()
+        
+    Returns:
+        Serialized <item> elements
+    """
+    # add_entry() prepends, so the feed lists the last-added episode first
+    return b''.join(render_item(episode) for episode in reversed(episodes))
+
+
+def _split_channel(payload: bytes) -> Tuple[bytes, bytes]:
+    """
+    Split a serialized feed right before its closing </channel> tag.
+    
+    The tag's indentation goes with the second part, so items inserted
+    between the two keep feedgen's pretty-printed layout.
+    
+    Args:
+        payload: RSS document produced by RSSManager.serialize_feed()
+        
+    Returns:
+        (head, tail) with head + tail == payload
+        
+    Raises:
+        ValueError: If the document has no </channel> tag
+    """
+    end = payload.rfind(CHANNEL_CLOSE)
+    if end < 0:
+        raise ValueError("Serialized feed has no </channel> tag to insert items before")
+    start = end
+    while start and payload[start - 1] in b' \t':
+        start -= 1
+    return payload[:start], payload[start:]
+
+
+def splice_items(payload: bytes, items: bytes) -> bytes:
+    """
+    Insert pre-rendered <item> elements at the end of a serialized feed's channel.
+    
+    Args:
+        payload: RSS document produced by RSSManager.serialize_feed()
+        items: Output of render_items()
+        
+    Returns:
+        RSS document with the items included
+        
+    Raises:
+        ValueError: If the document has no </channel> tag
+    """
+    head, tail = _split_channel(payload)
+    return head + items + tail
+
+
 class RSSManager:
     """Manage RSS podcast feed generation and updates."""
     
@@ -146,44 +453,7 @@ class RSSManager:
             fe = fg.add_entry()
             logger.debug(f"Created feed entry for {episode.guid}")
             
-            # Basic episode fields
-            fe.id(episode.guid)
-            fe.guid(episode.guid, permalink=False)
-            logger.debug(f"Set GUID: {episode.guid}")
-            
-            fe.title(episode.title)
-            logger.debug(f"Set title: {episode.title}")
-            
-            fe.link(href=episode.link)
-            logger.debug(f"Set link: {episode.link}")
-            
-            fe.description(episode.description)
-            logger.debug(f"Set description (length: {len(episode.description)} chars)")
-            
-            fe.pubDate(episode.pub_date)
-            logger.debug(f"Set pub date: {episode.pub_date}")
-            
-            # Enclosure (audio file)
-            logger.debug(f"Adding enclosure: {episode.audio_url}")
-            fe.enclosure(
-                url=episode.audio_url,
-                length=str(episode.audio_file_size),
-                type=episode.audio_mime_type
-            )
-            logger.debug("Enclosure added successfully")
-            
-            # iTunes episode tags
-            if episode.duration:
-                fe.podcast.itunes_duration(episode.duration)
-                logger.debug(f"Set duration: {episode.duration}")
-            
-            if episode.image_url:
-                try:
-                    # Try to add thumbnail, but skip if format is not supported (e.g., WebP)
-                    fe.podcast.itunes_image(episode.image_url)
-                    logger.debug(f"Set thumbnail: {episode.image_url}")
-                except Exception as e:
-                    logger.warning(f"Could not add thumbnail for episode {episode.guid}: {e}")
+            fill_entry(fe, episode)
             
             logger.info(f"✅ Successfully added episode {episode.guid} to feed")
             return fe
@@ -192,6 +462,33 @@ class RSSManager:
             logger.error(f"❌ Failed to add episode {episode.guid} to feed: {e}", exc_info=True)
             raise
     
+    def remap_media_urls(self, fg: FeedGenerator, url_map: Dict[str, str]) -> int:
+        """
+        Replace enclosure URLs in a single pass over the feed entries.
+        
+        Args:
+            fg: FeedGenerator instance
+            url_map: Mapping of old enclosure URL -> new URL
+            
+        Returns:
+            Number of enclosures updated
+        """
+        if not url_map:
+            return 0
+        
+        updated = 0
+        for fe in fg.entry():
+            enclosure = fe.enclosure()
+            if not enclosure:
+                continue
+            new_url = url_map.get(enclosure.get('url'))
+            if new_url:
+                fe.enclosure(new_url, enclosure.get('length', '0'), enclosure.get('type', MIME_MPEG))
+                updated += 1
+        
+        logger.info(f"Remapped {updated} enclosure URL(s)")
+        return updated
+    
     def load_existing_feed(self, rss_file: Path) -> Optional[FeedGenerator]:
         """
         Load existing RSS feed from file, including all existing episodes.
@@ -210,7 +507,7 @@ class RSSManager:
             fg.load_extension('podcast')
             
             # Parse existing XML
-            tree = ET.parse(rss_file)
+            tree = parse_rss_file(rss_file)
             root = tree.getroot()
             
             # Extract channel info
@@ -262,7 +559,7 @@ class RSSManager:
                         if enclosure is not None:
                             url = enclosure.get('url')
                             length = enclosure.get('length', '0')
-                            mime = enclosure.get('type', 'audio/mp4')
+                            mime = sys.intern(enclosure.get('type', 'audio/mp4'))
                             if url:
                                 fe.enclosure(url, length, mime)
                         
@@ -272,13 +569,11 @@ class RSSManager:
                             fe.pubDate(pub_date_elem.text)
                         
                         # iTunes tags
-                        itunes_ns = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
-                        
-                        duration_elem = item.find(f'{itunes_ns}duration')
+                        duration_elem = item.find(ITUNES_DURATION)
                         if duration_elem is not None and duration_elem.text:
                             fe.podcast.itunes_duration(duration_elem.text)
                         
-                        image_elem = item.find(f'{itunes_ns}image')
+                        image_elem = item.find(ITUNES_IMAGE)
                         if image_elem is not None:
                             href = image_elem.get('href')
                             if href:
@@ -318,7 +613,7 @@ class RSSManager:
             return set()
         
         try:
-            tree = ET.parse(rss_file)
+            tree = parse_rss_file(rss_file)
             root = tree.getroot()
             
             guids = set()
@@ -335,21 +630,20 @@ class RSSManager:
             logger.warning(f"Failed to read existing GUIDs: {e}")
             return set()
     
-    def save_feed(self, fg: FeedGenerator, rss_file: Path, max_items: Optional[int] = None) -> None:
+    def serialize_feed(self, fg: FeedGenerator, max_items: Optional[int] = None) -> bytes:
         """
-        Save feed to file, optionally limiting number of items.
+        Serialize feed to RSS XML, optionally limiting number of items.
+        
+        Serialize once and hand the result to write_feed() for every
+        destination instead of calling save_feed() repeatedly.
         
         Args:
             fg: FeedGenerator instance
-            rss_file: Path to save RSS file
             max_items: Maximum number of items to keep (None = no limit)
+            
+        Returns:
+            RSS document as UTF-8 encoded bytes
         """
-        logger.info(f"Saving RSS feed to: {rss_file}")
-        
-        # Ensure parent directory exists
-        rss_file.parent.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"RSS directory verified: {rss_file.parent}")
-        
         # Count current episodes
         entries = fg.entry()
         logger.info(f"Feed contains {len(entries)} episodes")
@@ -365,11 +659,27 @@ class RSSManager:
         # Update lastBuildDate to current time (important for podcast apps to detect updates)
         fg.lastBuildDate(datetime.now(timezone.utc))
         logger.debug("Updated lastBuildDate to current time")
-
+        
+        return fg.rss_str(pretty=True)
+    
+    def write_feed(self, payload: bytes, rss_file: Path) -> None:
+        """
+        Write serialized feed to file.
+        
+        Args:
+            payload: RSS document produced by serialize_feed()
+            rss_file: Path to save RSS file
+        """
+        logger.info(f"Saving RSS feed to: {rss_file}")
+        
+        # Ensure parent directory exists
+        rss_file.parent.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"RSS directory verified: {rss_file.parent}")
+        
         # Write RSS file
         try:
             logger.debug(f"Writing RSS to file: {rss_file}")
-            fg.rss_file(str(rss_file), pretty=True)
+            rss_file.write_bytes(payload)
             
             # Verify file was created and log size
             if rss_file.exists():
@@ -384,3 +694,68 @@ class RSSManager:
         except Exception as e:
             logger.error(f"❌ Failed to save RSS feed: {e}", exc_info=True)
             raise
+    
+    def stream_feed(
+        self,
+        fg: FeedGenerator,
+        episodes: Iterable[EpisodeData],
+        rss_file: Path,
+        max_items: Optional[int] = None,
+    ) -> int:
+        """
+        Write a feed to file, rendering episodes as they arrive.
+        
+        The channel of fg is written first, then each episode is rendered
+        with render_item() and written straight away, so the episodes are
+        never held in memory. Unlike add_episode(), episodes appear in the
+        feed in the order they are yielded. The file is written next to
+        rss_file and moved into place at the end, so episodes may be
+        streamed out of rss_file itself.
+        
+        Args:
+            fg: FeedGenerator holding the channel; episodes already added
+                to it are listed before the streamed ones
+            episodes: Episodes in feed order
+            rss_file: Path to save RSS file
+            max_items: Maximum number of items to keep (None = no limit)
+            
+        Returns:
+            Number of episodes streamed
+        """
+        head, tail = _split_channel(self.serialize_feed(fg))
+        
+        rss_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = rss_file.with_name(rss_file.name + '.tmp')
+        
+        count = 0
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(head)
+                for episode in episodes:
+                    f.write(render_item(episode))
+                    count += 1
+                f.write(tail)
+            os.replace(tmp_file, rss_file)
+        except Exception as e:
+            logger.error(f"❌ Failed to save RSS feed: {e}", exc_info=True)
+            tmp_file.unlink(missing_ok=True)
+            raise
+        
+        if max_items and max_items > 0 and count > max_items:
+            logger.warning(f"Feed has {count} items, but max is {max_items}. Trimming not yet implemented.")
+        
+        file_size = rss_file.stat().st_size
+        logger.info(f"✅ RSS feed saved successfully - Size: {file_size / 1024:.2f} KB ({file_size} bytes)")
+        logger.info(f"RSS file: {rss_file}")
+        return count
+    
+    def save_feed(self, fg: FeedGenerator, rss_file: Path, max_items: Optional[int] = None) -> None:
+        """
+        Save feed to file, optionally limiting number of items.
+        
+        Args:
+            fg: FeedGenerator instance
+            rss_file: Path to save RSS file
+            max_items: Maximum number of items to keep (None = no limit)
+        """
+        self.write_feed(self.serialize_feed(fg, max_items), rss_file)
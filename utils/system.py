@@ -0,0 +1,21 @@
+"""
+System resource helpers shared by the converter, downloader and scripts.
+"""
+
+import os
+
+
+def effective_cpu_count() -> int:
+    """
+    Number of CPUs this process may actually run on.
+    
+    Honors the CPU affinity mask (taskset, container cpusets) where the
+    platform exposes it, instead of the host's total CPU count.
+    
+    Returns:
+        Usable CPU count (at least 1)
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
@@ -2,9 +2,9 @@
 YouTube URL processing and validation utilities.
 """
 
-import re
-from urllib.parse import urlparse, parse_qs
-from typing import Optional, List
+import string
+from urllib.parse import ParseResult, urlparse, parse_qs
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
 
@@ -53,7 +53,8 @@ class YouTubeURLProcessor:
     """
     
     # YouTube video ID: 11 characters, alphanumeric, underscore, hyphen
-    VIDEO_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+    VIDEO_ID_LENGTH = 11
+    VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
     
     # Valid YouTube domains
     VALID_DOMAINS = {
@@ -63,6 +64,9 @@ class YouTubeURLProcessor:
         'youtu.be',
     }
     
+    # youtube.com paths that are followed directly by the video ID
+    VIDEO_PATH_PREFIXES = ('/embed/', '/v/', '/live/', '/shorts/')
+    
     def __init__(self):
         """Initialize URL processor."""
         pass
@@ -78,18 +82,20 @@ class YouTubeURLProcessor:
         Returns:
             True if valid video ID format
         """
-        return bool(cls.VIDEO_ID_PATTERN.match(video_id))
+        return len(video_id) == cls.VIDEO_ID_LENGTH and cls.VIDEO_ID_CHARS.issuperset(video_id)
     
     @classmethod
-    def extract_video_id(cls, url: str) -> str:
+    def _parse(cls, url: str) -> Tuple[str, ParseResult, Optional[Dict[str, List[str]]]]:
         """
-        Extract video ID from a YouTube URL.
+        Split a YouTube URL once and extract its video ID.
         
         Args:
             url: YouTube URL
             
         Returns:
-            Video ID string
+            Tuple of (video_id, parsed_url, query_params). query_params is
+            only set when the query string had to be parsed to find the
+            video ID, so callers can reuse it instead of parsing it again.
             
         Raises:
             InvalidYouTubeURLError: If URL is not a valid YouTube URL
@@ -106,33 +112,24 @@ class YouTubeURLProcessor:
             )
         
         video_id = None
+        query_params = None
+        path = parsed.path
         
         # Handle youtu.be format
         if domain == 'youtu.be':
-            # Path is /VIDEO_ID
-            video_id = parsed.path.lstrip('/')
-            # Remove any additional path components
-            if '/' in video_id:
-                video_id = video_id.split('/')[0]
+            # Path is /VIDEO_ID; drop any additional path components
+            video_id = path.lstrip('/').split('/', 1)[0]
         
         # Handle youtube.com formats
+        elif path.startswith('/watch'):
+            query_params = parse_qs(parsed.query)
+            video_id = query_params.get('v', [None])[0]
         else:
-            # Check for /watch path
-            if parsed.path == '/watch' or parsed.path.startswith('/watch'):
-                query_params = parse_qs(parsed.query)
-                video_id = query_params.get('v', [None])[0]
-            # Handle /embed/VIDEO_ID format
-            elif parsed.path.startswith('/embed/'):
-                video_id = parsed.path.split('/embed/')[-1]
-            # Handle /v/VIDEO_ID format
-            elif parsed.path.startswith('/v/'):
-                video_id = parsed.path.split('/v/')[-1]
-            # Handle /live/VIDEO_ID format (live streams)
-            elif parsed.path.startswith('/live/'):
-                video_id = parsed.path.split('/live/')[-1]
-            # Handle /shorts/VIDEO_ID format (YouTube Shorts)
-            elif parsed.path.startswith('/shorts/'):
-                video_id = parsed.path.split('/shorts/')[-1]
+            # /embed/, /v/ (old format), /live/ (live streams), /shorts/ (Shorts)
+            for prefix in cls.VIDEO_PATH_PREFIXES:
+                if path.startswith(prefix):
+                    video_id = path.rpartition(prefix)[2]
+                    break
         
         if not video_id:
             raise InvalidYouTubeURLError(
@@ -152,7 +149,24 @@ class YouTubeURLProcessor:
                 f"Expected 11 alphanumeric characters, underscore, or hyphen."
             )
         
-        return video_id
+        return video_id, parsed, query_params
+    
+    @classmethod
+    def extract_video_id(cls, url: str) -> str:
+        """
+        Extract video ID from a YouTube URL.
+        
+        Args:
+            url: YouTube URL
+            
+        Returns:
+            Video ID string
+            
+        Raises:
+            InvalidYouTubeURLError: If URL is not a valid YouTube URL
+            InvalidVideoIDError: If video ID format is invalid
+        """
+        return cls._parse(url)[0]
     
     @classmethod
     def parse_url(cls, url: str) -> YouTubeURL:
@@ -168,11 +182,11 @@ class YouTubeURLProcessor:
         Raises:
             InvalidYouTubeURLError: If URL is not valid
         """
-        video_id = cls.extract_video_id(url)
+        video_id, parsed, query_params = cls._parse(url)
         
-        # Check for playlist
-        parsed = urlparse(url)
-        query_params = parse_qs(parsed.query)
+        # Check for playlist (reusing the query parsed for /watch URLs)
+        if query_params is None:
+            query_params = parse_qs(parsed.query)
         playlist_id = query_params.get('list', [None])[0]
         
         return YouTubeURL(
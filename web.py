@@ -480,13 +480,17 @@ def process_video_job(job_id: int, url: str):
         downloader = AudioDownloader(
             output_dir=settings.media_dir,
             audio_format=settings.audio_format,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            cache_dir=settings.podcast_dir / ".cache"
         )
         
-        audio_file, metadata = downloader.download_with_metadata(
-            url=parsed_url.original_url,
-            video_id=parsed_url.video_id
-        )
+        try:
+            audio_file, metadata = downloader.download_with_metadata(
+                url=parsed_url.original_url,
+                video_id=parsed_url.video_id
+            )
+        finally:
+            downloader.close()
         
         jobs[job_id]['message'] = 'Checking video duration...'
         jobs[job_id]['title'] = metadata.title
@@ -56,7 +56,8 @@ def main():
     
     downloader = AudioDownloader(
         output_dir=settings.media_dir,
-        audio_format=settings.audio_format
+        audio_format=settings.audio_format,
+        cache_dir=settings.podcast_dir / ".cache"
     )
     
     splitter = AudioSplitter()
@@ -193,6 +194,8 @@ def main():
             logger.error(f"  ✗ Failed to process video: {e}")
             continue
     
+    downloader.close()
+    
     # Save RSS feed
     rss_manager.save_feed(fg, settings.rss_file, max_items=settings.feed_max_items)
     